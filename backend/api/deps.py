@@ -65,29 +65,22 @@ database_registry: Dict[str, Dict[str, Any]] = {}
 # LANGGRAPH PIPELINE SINGLETON
 # =============================================================================
 
-_pipeline = None
-
-
 def get_orchestrator():
     """
-    Get or create the singleton LangGraph pipeline.
+    Get the singleton LangGraph pipeline.
 
-    The compiled pipeline is thread-safe and reused across all requests.
-    On first call, it compiles the StateGraph (fast, no model loading).
+    Delegates to backend.graph.get_pipeline(), which compiles the StateGraph
+    once per process (under a lock) and shares it across all requests, so
+    there is no second cached copy to keep in sync here.
 
     Returns:
         Compiled LangGraph Runnable
     """
-    global _pipeline
-    if _pipeline is None:
-        from backend.graph import get_pipeline
-        logger.info("Initializing LangGraph NL→SQL pipeline...")
-        _pipeline = get_pipeline()
-        logger.info("LangGraph pipeline ready.")
-    return _pipeline
+    from backend.graph import get_pipeline
+    return get_pipeline()
 
 
 def reset_orchestrator() -> None:
     """Reset the pipeline singleton (useful for testing)."""
-    global _pipeline
-    _pipeline = None
+    from backend.graph import reset_pipeline
+    reset_pipeline()
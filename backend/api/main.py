@@ -19,12 +19,14 @@ Endpoints (via routers):
 - GET  /health                    — Health check
 """
 
+import asyncio
 import os
 from contextlib import asynccontextmanager
 
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 
+from backend.cache import close_cache_client
 from backend.db_connection import test_connection, close_async_pool
 from configs import DATABASE_URL
 
@@ -64,6 +66,16 @@ def _init_default_database():
         )
 
 
+def _warm_pipeline():
+    """Build the pipeline's lazy singletons; failures just defer them to the first query."""
+    from backend.graph import warm_up
+    try:
+        warm_up()
+        logger.info("Pipeline warm-up complete.")
+    except Exception as exc:
+        logger.warning("Pipeline warm-up skipped: %s", exc)
+
+
 # =============================================================================
 # APP LIFECYCLE
 # =============================================================================
@@ -79,11 +91,25 @@ async def lifespan(app: FastAPI):
     # Pre-warm LangGraph pipeline (compiles graph, no model loading)
     get_orchestrator()
 
+    # Load the LLM chain, schema cache and RAG index in the background: startup
+    # isn't held up, and the first query no longer pays for them
+    warm_task = asyncio.create_task(asyncio.to_thread(_warm_pipeline))
+
     yield
 
-    # Shutdown: close async connection pool
+    # Cancelling a to_thread task doesn't stop its worker thread, so give an
+    # in-flight warm-up (schema introspection, FAISS build) a bounded wait to
+    # finish before the pools it may be using are torn down
+    if not warm_task.done():
+        try:
+            await asyncio.wait_for(asyncio.shield(warm_task), timeout=10)
+        except asyncio.TimeoutError:
+            logger.warning("Pipeline warm-up still running at shutdown; closing pools anyway.")
+
+    # Shutdown: close async connection pool + cache HTTP client
     logger.info("ReasonSQL 2.0 API shutting down.")
     await close_async_pool()
+    await close_cache_client()
 
 
 # =============================================================================
@@ -15,7 +15,6 @@ from fastapi import APIRouter, HTTPException, status
 
 from backend.db_connection import test_connection
 from backend.cache import get_cached, set_cached
-from configs import MAX_RETRIES
 
 from ..schemas import (
     QueryRequest, QueryResponse,
@@ -34,6 +33,27 @@ router = APIRouter(tags=["Query"])
 # HELPERS (shared with stream.py)
 # =============================================================================
 
+def _has_unrecovered_error(pipeline_state: dict) -> bool:
+    """
+    True when execution failed and self-correction did not recover.
+
+    If row_count > 0 the query succeeded even if execution_error still holds a
+    stale value from before self-correction succeeded.
+    """
+    intent = pipeline_state.get("intent", "DATA_QUERY")
+    recovered = pipeline_state.get("row_count", 0) > 0 or intent in ("META_QUERY", "AMBIGUOUS")
+    return bool(pipeline_state.get("execution_error", "")) and not recovered
+
+
+# Ordered (predicate, status) rules — first match wins, SUCCESS otherwise.
+_STATUS_RULES = (
+    (lambda s: bool(s.get("pipeline_error")), ExecutionStatusAPI.ERROR),
+    (_has_unrecovered_error, ExecutionStatusAPI.ERROR),
+    (lambda s: s.get("intent") == "AMBIGUOUS", ExecutionStatusAPI.BLOCKED),
+    (lambda s: s.get("row_count", 0) == 0 and s.get("intent") == "DATA_QUERY", ExecutionStatusAPI.EMPTY),
+)
+
+
 def _build_reasoning_trace_api(pipeline_state: dict) -> ReasoningTraceAPI:
     """
     Convert LangGraph PipelineState reasoning_trace list into ReasoningTraceAPI.
@@ -52,23 +72,10 @@ def _build_reasoning_trace_api(pipeline_state: dict) -> ReasoningTraceAPI:
         for entry in raw_trace
     ]
 
-    # Determine status — check self-correction recovery: if row_count > 0, the query succeeded
-    # even if execution_error has a stale value from before self-correction succeeded.
-    row_count = pipeline_state.get("row_count", 0)
-    intent = pipeline_state.get("intent", "DATA_QUERY")
-    exec_error = pipeline_state.get("execution_error", "")
-    recovered = row_count > 0 or intent in ("META_QUERY", "AMBIGUOUS")
-
-    if pipeline_state.get("pipeline_error"):
-        final_status = ExecutionStatusAPI.ERROR
-    elif bool(exec_error) and not recovered:
-        final_status = ExecutionStatusAPI.ERROR
-    elif pipeline_state.get("intent") == "AMBIGUOUS":
-        final_status = ExecutionStatusAPI.BLOCKED
-    elif pipeline_state.get("row_count", 0) == 0 and pipeline_state.get("intent") == "DATA_QUERY":
-        final_status = ExecutionStatusAPI.EMPTY
-    else:
-        final_status = ExecutionStatusAPI.SUCCESS
+    final_status = next(
+        (st for predicate, st in _STATUS_RULES if predicate(pipeline_state)),
+        ExecutionStatusAPI.SUCCESS,
+    )
 
     return ReasoningTraceAPI(
         actions=actions,
@@ -160,7 +167,7 @@ async def execute_query(request: QueryRequest):
 
     # Live connection re-check if registry says disconnected
     if not db_info.get("connected"):
-        live_status = test_connection()
+        live_status = await asyncio.to_thread(test_connection)
         if live_status.get("connected"):
             db_info["connected"] = True
         else:
@@ -170,7 +177,10 @@ async def execute_query(request: QueryRequest):
             )
 
     # ── Cache check ──────────────────────────────────────────────────────────
-    cached = await get_cached(request.query, db_id)
+    # The cache key is (query, database) only — a follow-up turn depends on its
+    # conversation, so it must neither replay nor store a context-free answer
+    use_cache = not request.history
+    cached = await get_cached(request.query, db_id) if use_cache else None
     if cached:
         # Deserialize and return cached QueryResponse
         try:
@@ -185,14 +195,8 @@ async def execute_query(request: QueryRequest):
         thread_id = request.thread_id or str(uuid.uuid4())
 
         # Initial state for LangGraph pipeline
-        initial_state = {
-            "user_query": request.query,
-            "history": request.history or [],
-            "messages": [],
-            "retry_count": 0,
-            "max_retries": MAX_RETRIES,
-            "reasoning_trace": [],
-        }
+        from backend.graph import initial_state as build_initial_state
+        initial_state = build_initial_state(request.query, request.history)
 
         config = {"configurable": {"thread_id": thread_id}}
 
@@ -224,7 +228,7 @@ async def execute_query(request: QueryRequest):
         )
 
         # ── Cache successful results ─────────────────────────────────────────
-        if response.success and response.row_count >= 0:
+        if use_cache and response.success and response.row_count >= 0:
             await set_cached(request.query, db_id, response.model_dump())
 
         return response
@@ -6,6 +6,7 @@ as the LangGraph pipeline processes each node.
 
 Event format:
     data: {"type": "node_complete", "node": "schema_retrieval", "summary": "...", "step": 1}\n\n
+    data: {"type": "node_complete", "node": "sql_generation", ..., "sql": "SELECT ..."}\n\n
     data: {"type": "result", "data": {<full QueryResponse JSON>}}\n\n
     data: [DONE]\n\n
 
@@ -25,12 +26,13 @@ import json
 import logging
 import time
 import uuid
-from typing import AsyncGenerator
+from typing import AsyncGenerator, NamedTuple
 
 from fastapi import APIRouter
 from fastapi.responses import StreamingResponse
 
-from configs import MAX_RETRIES
+from backend.cache import get_cached, set_cached
+
 from ..schemas import QueryRequest, ExecutionStatusAPI, AgentActionAPI, ReasoningTraceAPI, QueryResponse
 from ..deps import database_registry, get_orchestrator, logger, QUERY_TIMEOUT_SECONDS
 
@@ -43,28 +45,41 @@ _stream_logger = logging.getLogger("reasonsql.stream")
 # NODE → HUMAN-READABLE LABEL MAP
 # =============================================================================
 
+class NodeLabel(NamedTuple):
+    icon: str
+    label: str
+    description: str
+
+
 NODE_LABELS = {
-    "schema_retrieval": ("🔍", "Schema Retrieval", "Loading database schema via hybrid RAG"),
-    "reasoning": ("🧠", "Reasoning & Planning", "Analyzing intent, resolving ambiguity, planning query"),
-    "sql_generation": ("⚙️", "SQL Generation", "Generating PostgreSQL query"),
-    "safety_validation": ("🛡️", "Safety Validation", "Checking for forbidden keywords, enforcing LIMIT"),
-    "sql_execution": ("▶️", "SQL Execution", "Running query against the database"),
-    "self_correction": ("🔄", "Self-Correction", "Fixing failed SQL query"),
-    "response_synthesis": ("✨", "Response Synthesis", "Synthesizing human-readable answer"),
+    "schema_retrieval": NodeLabel("🔍", "Schema Retrieval", "Loading database schema via hybrid RAG"),
+    "reasoning": NodeLabel("🧠", "Reasoning & Planning", "Analyzing intent, resolving ambiguity, planning query"),
+    "sql_generation": NodeLabel("⚙️", "SQL Generation", "Generating PostgreSQL query"),
+    "safety_validation": NodeLabel("🛡️", "Safety Validation", "Checking for forbidden keywords, enforcing LIMIT"),
+    "sql_execution": NodeLabel("▶️", "SQL Execution", "Running query against the database"),
+    "self_correction": NodeLabel("🔄", "Self-Correction", "Fixing failed SQL query"),
+    "response_synthesis": NodeLabel("✨", "Response Synthesis", "Synthesizing human-readable answer"),
 }
 
 
-def _node_event(node_name: str, step: int, detail: str = "") -> str:
-    """Format a node_complete SSE event."""
-    icon, label, default_desc = NODE_LABELS.get(node_name, ("⚡", node_name, ""))
+# Nodes that produce or rewrite the SQL — their events carry it so the client can
+# show the query while execution and answer synthesis are still running.
+SQL_NODES = frozenset({"sql_generation", "safety_validation", "self_correction"})
+
+
+def _node_event(node_name: str, step: int, detail: str = "", sql: str = "") -> str:
+    """Format a node_complete SSE event (with the current SQL, if any)."""
+    spec = NODE_LABELS.get(node_name) or NodeLabel("⚡", node_name, "")
     payload = {
         "type": "node_complete",
         "node": node_name,
-        "label": label,
-        "icon": icon,
-        "description": detail or default_desc,
+        "label": spec.label,
+        "icon": spec.icon,
+        "description": detail or spec.description,
         "step": step,
     }
+    if sql:
+        payload["sql"] = sql
     return f"data: {json.dumps(payload)}\n\n"
 
 
@@ -77,6 +92,16 @@ def _result_event(response: QueryResponse) -> str:
     return f"data: {json.dumps(payload, default=str)}\n\n"
 
 
+# Static SSE framing, shared by every response instead of rebuilt per request
+SSE_MEDIA_TYPE = "text/event-stream"
+SSE_HEADERS = {
+    "Cache-Control": "no-cache",
+    "X-Accel-Buffering": "no",    # Disable Nginx buffering
+    "Connection": "keep-alive",
+}
+_DONE_EVENT = "data: [DONE]\n\n"
+
+
 def _error_event(message: str) -> str:
     """Format an error SSE event."""
     payload = {"type": "error", "message": message}
@@ -103,30 +128,40 @@ async def stream_query(request: QueryRequest):
     if not db_info:
         async def err_gen():
             yield _error_event(f"Database '{db_id}' not registered")
-        return StreamingResponse(err_gen(), media_type="text/event-stream",
-                                  headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"})
+        return StreamingResponse(err_gen(), media_type=SSE_MEDIA_TYPE, headers=SSE_HEADERS)
 
     thread_id = request.thread_id or str(uuid.uuid4())
 
-    async def event_generator() -> AsyncGenerator[str, None]:
-        pipeline = get_orchestrator()
-
-        initial_state = {
-            "user_query": request.query,
-            "history": request.history or [],
-            "messages": [],
-            "retry_count": 0,
-            "max_retries": MAX_RETRIES,
-            "reasoning_trace": [],
-        }
-
-        config = {"configurable": {"thread_id": thread_id}}
+    # The cache key is (query, database) only — a follow-up turn depends on its
+    # conversation, so it must neither replay nor store a context-free answer
+    use_cache = not request.history
 
+    async def event_generator() -> AsyncGenerator[str, None]:
         step = 0
         final_state = {}
         run_id = None
 
         try:
+            # ── Cache check (same key as POST /query) — replay skips the pipeline ──
+            if use_cache:
+                cached = await get_cached(request.query, db_id)
+                if cached:
+                    try:
+                        cached_response = QueryResponse(**{**cached, "cache_hit": True})
+                    except Exception:
+                        cached_response = None  # If deserialization fails, re-run the query
+                    if cached_response is not None:
+                        yield _result_event(cached_response)
+                        yield _DONE_EVENT
+                        return
+
+            pipeline = get_orchestrator()
+
+            from backend.graph import initial_state as build_initial_state
+            initial_state = build_initial_state(request.query, request.history)
+
+            config = {"configurable": {"thread_id": thread_id}}
+
             # astream yields partial state updates after each node completes
             async for chunk in pipeline.astream(initial_state, config=config):
                 for node_name, node_state in chunk.items():
@@ -139,35 +174,33 @@ async def stream_query(request: QueryRequest):
                     trace = node_state.get("reasoning_trace", [])
                     detail = trace[-1].get("summary", "") if trace else ""
 
-                    yield _node_event(node_name, step, detail)
+                    sql = ""
+                    if node_name in SQL_NODES:
+                        sql = node_state.get("corrected_sql") or node_state.get("generated_sql", "")
+
+                    yield _node_event(node_name, step, detail, sql)
 
                     # Accumulate final state (last complete state wins)
                     final_state.update(node_state)
 
-                    # Small delay to ensure events flush through proxies
-                    await asyncio.sleep(0.01)
-
             # Build QueryResponse from accumulated final state
             from ..routers.query import _build_reasoning_trace_api, _build_query_response_from_state
             response = _build_query_response_from_state(final_state, run_id=run_id)
 
+            # Cache before yielding: the client stops reading once it has the
+            # result, so code after that yield may never run
+            if use_cache and response.success and response.row_count >= 0:
+                await set_cached(request.query, db_id, response.model_dump())
+
             yield _result_event(response)
-            yield "data: [DONE]\n\n"
+            yield _DONE_EVENT
 
         except asyncio.TimeoutError:
             yield _error_event(f"Query timed out after {QUERY_TIMEOUT_SECONDS}s")
-            yield "data: [DONE]\n\n"
+            yield _DONE_EVENT
         except Exception as exc:
             _stream_logger.exception("Streaming query failed: %s", request.query[:100])
             yield _error_event(f"Internal error: {str(exc)[:200]}")
-            yield "data: [DONE]\n\n"
-
-    return StreamingResponse(
-        event_generator(),
-        media_type="text/event-stream",
-        headers={
-            "Cache-Control": "no-cache",
-            "X-Accel-Buffering": "no",    # Disable Nginx buffering
-            "Connection": "keep-alive",
-        },
-    )
+            yield _DONE_EVENT
+
+    return StreamingResponse(event_generator(), media_type=SSE_MEDIA_TYPE, headers=SSE_HEADERS)
@@ -1,3 +1,4 @@
+import asyncio
 import os
 import time
 from urllib.parse import urlparse, unquote
@@ -29,8 +30,8 @@ async def health_check():
     if _health_cache["result"] and now < _health_cache["expires"]:
         return _health_cache["result"]
     
-    # Get live database info
-    db_info = test_connection()
+    # Get live database info (blocking psycopg2 round-trip — keep it off the event loop)
+    db_info = await asyncio.to_thread(test_connection)
     db_connected = db_info.get("connected", False)
     db_type = db_info.get("db_type", "unknown")
     table_count = db_info.get("table_count", 0)
@@ -30,7 +30,7 @@ import logging
 import pandas as pd
 from fastapi import APIRouter, UploadFile, File, HTTPException
 
-from backend.db_connection import execute_write_async, get_db_type
+from backend.db_connection import execute_write_async, get_db_type, invalidate_schema_cache
 
 logger = logging.getLogger(__name__)
 
@@ -108,6 +108,7 @@ async def _import_dataframe(df: pd.DataFrame, table_name: str) -> dict:
         f"CREATE TABLE IF NOT EXISTS {table_name} ({', '.join(columns_sql)});"
     )
     await execute_write_async(create_sql)
+    invalidate_schema_cache()  # new table must be visible to the next query
 
     # INSERT rows
     cols_str = ", ".join(safe_cols)
@@ -5,8 +5,9 @@ Two-tier cache:
   1. Upstash Redis (HTTP REST) — persistent, survives Render restarts
   2. In-memory dict fallback — if UPSTASH_REDIS_REST_URL is not set
 
-Cache key: SHA-256(query.lower().strip() + ":" + database_id)
+Cache key: SHA-256(query.lower().strip() + ":" + database_id + ":" + LLM_MODEL)
 TTL: 300 seconds (5 minutes) by default
+In-memory tier is capped at CACHE_MAX_ENTRIES (oldest entry evicted first)
 
 Why Upstash over redis-py:
     - No Redis server needed on Render free tier
@@ -22,6 +23,8 @@ import os
 import time
 from typing import Any, Optional
 
+from configs import LLM_MODEL
+
 logger = logging.getLogger("reasonsql.cache")
 
 # ---------------------------------------------------------------------------
@@ -36,34 +39,51 @@ UPSTASH_URL = os.getenv("UPSTASH_REDIS_REST_URL", "")
 UPSTASH_TOKEN = os.getenv("UPSTASH_REDIS_REST_TOKEN", "")
 CACHE_ENABLED = os.getenv("CACHE_ENABLED", "true").lower() == "true"
 DEFAULT_TTL = int(os.getenv("CACHE_TTL_SECONDS", "300"))
+MAX_MEMORY_ENTRIES = int(os.getenv("CACHE_MAX_ENTRIES", "64"))
 
 if UPSTASH_URL:
     logger.info("Cache: Upstash Redis enabled (%s…)", UPSTASH_URL[:40])
 else:
     logger.info("Cache: In-memory fallback (set UPSTASH_REDIS_REST_URL for persistent cache)")
 
+# Shared Upstash HTTP client — keeps the TLS connection alive between cache
+# calls instead of paying a fresh handshake on every GET/SET.
+_http_client = None
+
 
 # =============================================================================
 # HELPERS
 # =============================================================================
 
+def _get_http_client():
+    """Get or create the shared Upstash httpx.AsyncClient."""
+    global _http_client
+    if _http_client is None or _http_client.is_closed:
+        import httpx
+        _http_client = httpx.AsyncClient(
+            timeout=2.0,
+            headers={"Authorization": f"Bearer {UPSTASH_TOKEN}"},
+        )
+    return _http_client
+
+
 def _make_key(query: str, database_id: str) -> str:
-    """Stable SHA-256 cache key from query + database_id."""
-    raw = f"{query.lower().strip()}:{database_id}"
+    """
+    Stable SHA-256 cache key from query + database_id + primary model.
+
+    The model is part of the key so switching LLM_MODEL doesn't keep serving
+    answers generated by the previous model.
+    """
+    raw = f"{query.lower().strip()}:{database_id}:{LLM_MODEL}"
     return "rsql:" + hashlib.sha256(raw.encode()).hexdigest()[:32]
 
 
 async def _upstash_get(key: str) -> Optional[str]:
     """GET from Upstash Redis REST API."""
     try:
-        import httpx
-        async with httpx.AsyncClient(timeout=2.0) as client:
-            r = await client.get(
-                f"{UPSTASH_URL}/get/{key}",
-                headers={"Authorization": f"Bearer {UPSTASH_TOKEN}"},
-            )
-            data = r.json()
-            return data.get("result")  # None if key doesn't exist
+        r = await _get_http_client().get(f"{UPSTASH_URL}/get/{key}")
+        data = r.json()
+        return data.get("result")  # None if key doesn't exist
     except Exception as exc:
         logger.debug("Upstash GET failed (non-critical): %s", exc)
         return None
@@ -72,12 +92,7 @@ async def _upstash_get(key: str) -> Optional[str]:
 async def _upstash_set(key: str, value: str, ttl: int) -> None:
     """SET with EX in Upstash Redis REST API."""
     try:
-        import httpx
-        async with httpx.AsyncClient(timeout=2.0) as client:
-            await client.get(
-                f"{UPSTASH_URL}/set/{key}/{value}/ex/{ttl}",
-                headers={"Authorization": f"Bearer {UPSTASH_TOKEN}"},
-            )
+        await _get_http_client().get(f"{UPSTASH_URL}/set/{key}/{value}/ex/{ttl}")
     except Exception as exc:
         logger.debug("Upstash SET failed (non-critical): %s", exc)
 
@@ -139,24 +154,31 @@ async def set_cached(query: str, database_id: str, result: dict, ttl: int = DEFA
         # Upstash URL-encodes the value automatically when using /set/key/value/ex/ttl
         # For complex JSON, use POST to /pipeline instead
         try:
-            import httpx
-            async with httpx.AsyncClient(timeout=2.0) as client:
-                await client.post(
-                    f"{UPSTASH_URL}/pipeline",
-                    headers={
-                        "Authorization": f"Bearer {UPSTASH_TOKEN}",
-                        "Content-Type": "application/json",
-                    },
-                    content=json.dumps([["SET", key, serialized, "EX", ttl]]),
-                )
+            await _get_http_client().post(
+                f"{UPSTASH_URL}/pipeline",
+                headers={"Content-Type": "application/json"},
+                content=json.dumps([["SET", key, serialized, "EX", ttl]]),
+            )
         except Exception as exc:
             logger.debug("Upstash pipeline SET failed (non-critical): %s", exc)
 
-    # Always write to in-memory
+    # Always write to in-memory — re-inserting moves the key to the newest slot,
+    # so the dict's insertion order doubles as the eviction order.
+    _memory_cache.pop(key, None)
+    while len(_memory_cache) >= MAX_MEMORY_ENTRIES > 0:
+        del _memory_cache[next(iter(_memory_cache))]
     _memory_cache[key] = (result, time.time() + ttl)
     logger.info("Cache SET (TTL=%ds): %s…", ttl, query[:60])
 
 
+async def close_cache_client() -> None:
+    """Close the shared Upstash HTTP client (call on app shutdown)."""
+    global _http_client
+    if _http_client is not None:
+        await _http_client.aclose()
+        _http_client = None
+
+
 def get_cache_stats() -> dict:
     """Return current in-memory cache stats."""
     now = time.time()
@@ -166,4 +188,5 @@ def get_cache_stats() -> dict:
         "enabled": CACHE_ENABLED,
         "live_entries": live,
         "total_entries": len(_memory_cache),
+        "max_entries": MAX_MEMORY_ENTRIES,
     }
@@ -21,7 +21,9 @@ Usage:
 """
 
 import os
+import time
 import logging
+import threading
 from typing import List, Dict, Any, Optional, Generator
 from contextlib import contextmanager
 
@@ -30,7 +32,7 @@ from sqlalchemy.orm import sessionmaker, Session
 from sqlalchemy.pool import QueuePool
 from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession, async_sessionmaker
 
-from configs import DATABASE_URL, DB_POOL_SIZE, DB_MAX_OVERFLOW
+from configs import DATABASE_URL, DB_POOL_SIZE, DB_MAX_OVERFLOW, SCHEMA_CACHE_TTL
 
 logger = logging.getLogger("reasonsql.db")
 
@@ -256,13 +258,51 @@ def get_full_schema() -> Dict[str, Dict[str, Any]]:
     return schema
 
 
+# Introspection costs ~3 inspector round-trips per table, and the schema rarely
+# changes between queries — cache the text form for SCHEMA_CACHE_TTL seconds.
+_schema_text_cache: Optional[tuple] = None   # (schemas, expires_at)
+_schema_generation = 0                        # bumped by invalidate_schema_cache()
+_schema_rebuild_lock = threading.Lock()       # one introspection at a time
+_schema_cache_lock = threading.Lock()         # guards cache + generation (held briefly)
+
+
 def get_schema_as_text() -> Dict[str, str]:
     """
     Get schema as human-readable text strings for embedding/LLM context.
 
+    Served from a TTL cache (SCHEMA_CACHE_TTL seconds); call
+    invalidate_schema_cache() after DDL to pick up changes immediately.
+
     Returns:
         Dict mapping table_name → formatted schema string
     """
+    global _schema_text_cache
+    entry = _schema_text_cache
+    if entry is None or time.time() >= entry[1]:
+        with _schema_rebuild_lock:
+            entry = _schema_text_cache
+            if entry is None or time.time() >= entry[1]:
+                with _schema_cache_lock:
+                    generation = _schema_generation
+                entry = (_build_schema_text(), time.time() + SCHEMA_CACHE_TTL)
+                with _schema_cache_lock:
+                    # An invalidation during the rebuild means this snapshot may
+                    # predate the DDL: serve it to this caller, but don't cache it
+                    if generation == _schema_generation:
+                        _schema_text_cache = entry
+    return dict(entry[0])
+
+
+def invalidate_schema_cache() -> None:
+    """Drop the cached schema text (e.g. after CREATE TABLE)."""
+    global _schema_text_cache, _schema_generation
+    with _schema_cache_lock:
+        _schema_generation += 1
+        _schema_text_cache = None
+
+
+def _build_schema_text() -> Dict[str, str]:
+    """Introspect the database and format each table as a schema string."""
     schema = get_full_schema()
     result = {}
     for table, info in schema.items():
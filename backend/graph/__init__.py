@@ -10,7 +10,10 @@ Public API:
     result = await pipeline.ainvoke({"user_query": "..."})
 """
 
-from .state import PipelineState
-from .pipeline import build_pipeline, get_pipeline
+from .state import PipelineState, initial_state
+from .pipeline import build_pipeline, get_pipeline, reset_pipeline
+from .nodes import warm_up
 
-__all__ = ["PipelineState", "build_pipeline", "get_pipeline"]
+__all__ = [
+    "PipelineState", "initial_state", "build_pipeline", "get_pipeline", "reset_pipeline", "warm_up",
+]
@@ -15,9 +15,13 @@ Why function-based nodes:
     - No class inheritance needed — functions are first-class citizens in LangGraph
 """
 
+import asyncio
 import json
+import re
 import time
 import logging
+import threading
+import weakref
 from typing import Any, Dict, List
 
 from langchain_core.messages import HumanMessage
@@ -45,6 +49,7 @@ from backend.llm.output_schemas import (
 from configs import (
     FORBIDDEN_KEYWORDS,
     DEFAULT_LIMIT,
+    LLM_CONCURRENCY,
     MAX_RETRIES,
     RAG_THRESHOLD_TABLES,
     VERBOSE,
@@ -64,12 +69,39 @@ _schema_indexer: SchemaIndexer | None = None
 _hybrid_retriever: HybridSchemaRetriever | None = None
 _llm = None  # LangChain fallback chain
 
+# Shared by every request in the process; guards first init and index rebuilds
+_llm_lock = threading.Lock()
+_retriever_lock = threading.Lock()
+
+# Caps LLM requests in flight across all queries: a burst of users queues here
+# instead of tripping Gemini/Groq free-tier rate limits and retrying.
+# asyncio primitives bind to the first loop that waits on them, so there is one
+# per running loop (tests, scripts and the CLI may each run their own).
+_llm_semaphores: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, asyncio.Semaphore]" = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def _get_llm_semaphore() -> asyncio.Semaphore:
+    """Get the LLM concurrency semaphore for the running event loop."""
+    loop = asyncio.get_running_loop()
+    sem = _llm_semaphores.get(loop)
+    if sem is None:
+        sem = _llm_semaphores[loop] = asyncio.Semaphore(LLM_CONCURRENCY)
+    return sem
+
+
+def _indexed_tables() -> set:
+    return {d.metadata["table"] for d in (_schema_indexer.documents or [])}
+
 
 def _get_llm():
     """Get or initialize the LangChain LLM fallback chain."""
     global _llm
     if _llm is None:
-        _llm = get_llm_with_fallback(temperature=0.1)
+        with _llm_lock:
+            if _llm is None:
+                _llm = get_llm_with_fallback(temperature=0.1)
     return _llm
 
 
@@ -77,21 +109,41 @@ def _get_retriever(table_schemas: Dict[str, str]) -> HybridSchemaRetriever:
     """Get or rebuild the hybrid retriever when schema changes."""
     global _schema_indexer, _hybrid_retriever
 
-    if _schema_indexer is None or set(table_schemas.keys()) != set(
-        d.metadata["table"] for d in (_schema_indexer.documents or [])
-    ):
-        logger.info("Rebuilding FAISS index for %d tables...", len(table_schemas))
-        _schema_indexer = SchemaIndexer()
-        _schema_indexer.index_schema(table_schemas)
-        _hybrid_retriever = HybridSchemaRetriever(_schema_indexer)
+    tables = set(table_schemas.keys())
+    if _schema_indexer is None or tables != _indexed_tables():
+        with _retriever_lock:
+            # Another request may have rebuilt it while we waited
+            if _schema_indexer is None or tables != _indexed_tables():
+                logger.info("Rebuilding FAISS index for %d tables...", len(table_schemas))
+                indexer = SchemaIndexer()
+                indexer.index_schema(table_schemas)
+                _hybrid_retriever = HybridSchemaRetriever(indexer)
+                _schema_indexer = indexer
 
     return _hybrid_retriever
 
 
+def warm_up() -> None:
+    """
+    Build the lazy singletons ahead of the first query (blocking — run off-loop).
+
+    Loads the LLM fallback chain, primes the schema cache and, when the schema
+    is large enough to go through RAG, builds the FAISS index.
+    """
+    _get_llm()
+    table_schemas = get_schema_as_text()
+    if len(table_schemas) > RAG_THRESHOLD_TABLES:
+        _get_retriever(table_schemas)
+
+
 # =============================================================================
 # HELPER: SAFE LLM INVOCATION WITH JSON PARSING
 # =============================================================================
 
+# Outermost {...} span in a chatty LLM reply (compiled once, used on the fallback path)
+_JSON_OBJECT_RE = re.compile(r"\{.*\}", re.DOTALL)
+
+
 async def _invoke_llm_json(prompt_template, variables: Dict[str, Any]) -> Dict[str, Any]:
     """
     Invoke an LLM with a ChatPromptTemplate and parse the JSON response.
@@ -109,7 +161,8 @@ async def _invoke_llm_json(prompt_template, variables: Dict[str, Any]) -> Dict[s
     llm = _get_llm()
     chain = prompt_template | llm
 
-    response = await chain.ainvoke(variables)
+    async with _get_llm_semaphore():
+        response = await chain.ainvoke(variables)
     content = response.content.strip()
 
     # Strip markdown code fences if present (```json ... ```)
@@ -122,8 +175,7 @@ async def _invoke_llm_json(prompt_template, variables: Dict[str, Any]) -> Dict[s
         return json.loads(content)
     except json.JSONDecodeError as e:
         # Try to extract first JSON object from the response
-        import re
-        match = re.search(r"\{.*\}", content, re.DOTALL)
+        match = _JSON_OBJECT_RE.search(content)
         if match:
             return json.loads(match.group())
         raise ValueError(f"LLM returned non-JSON response: {content[:200]}") from e
@@ -155,7 +207,8 @@ async def _invoke_llm_structured(
     try:
         # Try structured output (provider function-calling / JSON schema)
         structured_chain = prompt_template | llm.with_structured_output(output_schema)
-        result = await structured_chain.ainvoke(variables)
+        async with _get_llm_semaphore():
+            result = await structured_chain.ainvoke(variables)
         logger.debug("[StructuredOutput] Success via %s", output_schema.__name__)
         return result.model_dump()
     except Exception as e:
@@ -195,8 +248,11 @@ async def schema_retrieval_node(state: PipelineState) -> PipelineState:
     logger.info("[SchemaRetrieval] Loading schema from database...")
 
     try:
-        # Get schema as text strings (table_name → formatted description)
-        table_schemas = get_schema_as_text()
+        # Get schema as text strings (table_name → formatted description).
+        # Both this introspection and the RAG step below are blocking (psycopg2,
+        # FAISS, CrossEncoder), so they run in worker threads — otherwise every
+        # other in-flight request's LLM call stalls behind them.
+        table_schemas = await asyncio.to_thread(get_schema_as_text)
         all_tables = list(table_schemas.keys())
         total_tables = len(all_tables)
 
@@ -209,8 +265,10 @@ async def schema_retrieval_node(state: PipelineState) -> PipelineState:
             logger.info("[SchemaRetrieval] Small schema (%d tables) — using full schema.", total_tables)
         else:
             # Large schema: hybrid retrieval + cross-encoder reranking
-            retriever = _get_retriever(table_schemas)
-            retrieved_tables = retriever.retrieve(state.get("user_query", ""))
+            retriever = await asyncio.to_thread(_get_retriever, table_schemas)
+            retrieved_tables = await asyncio.to_thread(
+                retriever.retrieve, state.get("user_query", "")
+            )
             method = "hybrid_rag"
             logger.info(
                 "[SchemaRetrieval] RAG selected %d/%d tables: %s",
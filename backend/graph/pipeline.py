@@ -26,6 +26,7 @@ LangSmith Integration:
 """
 
 import logging
+import threading
 from typing import Literal
 
 from langgraph.graph import StateGraph, END
@@ -259,6 +260,7 @@ def build_pipeline(checkpointer: MemorySaver | None = None):
 
 _pipeline = None
 _checkpointer: MemorySaver | None = None
+_pipeline_lock = threading.Lock()
 
 
 def get_checkpointer() -> MemorySaver:
@@ -273,8 +275,10 @@ def get_checkpointer() -> MemorySaver:
     """
     global _checkpointer
     if _checkpointer is None:
-        _checkpointer = MemorySaver()
-        logger.info("LangGraph MemorySaver checkpointer initialized.")
+        with _pipeline_lock:
+            if _checkpointer is None:
+                _checkpointer = MemorySaver()
+                logger.info("LangGraph MemorySaver checkpointer initialized.")
     return _checkpointer
 
 
@@ -289,12 +293,27 @@ def get_pipeline():
     - Conversation history persistence across turns (Feature E)
     - Human-in-the-loop interrupts (Feature H)
 
+    Concurrent first calls are serialized so the graph is compiled exactly
+    once per process.
+
     Returns:
         Compiled LangGraph Runnable with checkpointer
     """
     global _pipeline
     if _pipeline is None:
-        logger.info("Compiling LangGraph pipeline with MemorySaver checkpointer...")
         checkpointer = get_checkpointer()
-        _pipeline = build_pipeline(checkpointer=checkpointer)
+        with _pipeline_lock:
+            if _pipeline is None:
+                logger.info("Compiling LangGraph pipeline with MemorySaver checkpointer...")
+                _pipeline = build_pipeline(checkpointer=checkpointer)
     return _pipeline
+
+
+def reset_pipeline() -> None:
+    """Drop the compiled pipeline so the next get_pipeline() rebuilds it.
+
+    The checkpointer is kept, so conversation state survives the rebuild.
+    """
+    global _pipeline
+    with _pipeline_lock:
+        _pipeline = None
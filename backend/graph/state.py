@@ -14,6 +14,8 @@ Why TypedDict over dataclass:
 from typing import TypedDict, Annotated, List, Dict, Any, Optional
 from langgraph.graph.message import add_messages
 
+from configs import MAX_RETRIES
+
 
 class PipelineState(TypedDict, total=False):
     """
@@ -145,3 +147,20 @@ class PipelineState(TypedDict, total=False):
 
     pipeline_error: str
     """Set when the pipeline aborts due to an unrecoverable error."""
+
+
+def initial_state(user_query: str, history: Optional[List[Dict[str, str]]] = None) -> PipelineState:
+    """
+    Build the input state for one pipeline run.
+
+    Shared by the /query and /query/stream routers. The list fields are
+    created fresh on every call because nodes append to them in place.
+    """
+    return {
+        "user_query": user_query,
+        "history": history or [],
+        "messages": [],
+        "retry_count": 0,
+        "max_retries": MAX_RETRIES,
+        "reasoning_trace": [],
+    }
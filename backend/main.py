@@ -15,8 +15,10 @@ Usage:
 import sys
 from pathlib import Path
 
-# Add project root to path
-sys.path.insert(0, str(Path(__file__).parent.parent))
+# Add project root to path (once — re-imports must not stack duplicates)
+project_root = str(Path(__file__).parent.parent)
+if project_root not in sys.path:
+    sys.path.insert(0, project_root)
 
 from backend.orchestrator import NL2SQLOrchestrator, run_query
 from backend.models import FinalResponse, ExecutionStatus
@@ -70,10 +70,14 @@ class IntentAnalyzerOutput(BaseAgentOutput):
     @classmethod
     def from_text(cls, text: str, raw_intent: str) -> "IntentAnalyzerOutput":
         """Parse from agent text output (fallback)."""
+        # Case-fold the (possibly long) LLM text once, not once per keyword
+        text_upper = text.upper()
+        text_lower = text.lower()
+
         intent = IntentType.DATA_QUERY
-        if "META_QUERY" in text.upper():
+        if "META_QUERY" in text_upper:
             intent = IntentType.META_QUERY
-        elif "AMBIGUOUS" in text.upper():
+        elif "AMBIGUOUS" in text_upper:
             intent = IntentType.AMBIGUOUS
         
         status = AgentStatus.OK
@@ -87,8 +91,8 @@ class IntentAnalyzerOutput(BaseAgentOutput):
             confidence=0.8,
             relevant_tables=[],
             relevant_columns=[],
-            is_complex="complex" in text.lower(),
-            needs_data_context="recent" in text.lower() or "range" in text.lower()
+            is_complex="complex" in text_lower,
+            needs_data_context="recent" in text_lower or "range" in text_lower
         )
 
 
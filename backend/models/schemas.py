@@ -59,18 +59,20 @@ class SchemaContext(BaseModel):
     
     def get_table(self, name: str) -> Optional[TableInfo]:
         """Get table info by name (case-insensitive)."""
+        name_lower = name.lower()
         for table in self.tables:
-            if table.name.lower() == name.lower():
+            if table.name.lower() == name_lower:
                 return table
         return None
     
     def get_related_tables(self, table_name: str) -> List[str]:
         """Get all tables related to the given table via foreign keys."""
         related = set()
+        table_lower = table_name.lower()
         for rel in self.relationships:
-            if rel.from_table.lower() == table_name.lower():
+            if rel.from_table.lower() == table_lower:
                 related.add(rel.to_table)
-            elif rel.to_table.lower() == table_name.lower():
+            elif rel.to_table.lower() == table_lower:
                 related.add(rel.from_table)
         return list(related)
 
@@ -65,9 +65,15 @@ Aborts gracefully if exceeded (no silent overruns).
 Token limits prevent excessive TPD (tokens per day) usage on providers.
 """
 
+import sys
 import time
 import json
+import queue
+import atexit
+import logging
+import logging.handlers
 import sqlite3
+import threading
 from typing import Optional, Dict, Any, List
 from dataclasses import dataclass, field
 from collections import deque
@@ -84,6 +90,34 @@ from backend.utils.vector_search import schema_vector_store
 import hashlib
 
 
+logger = logging.getLogger("reasonsql.orchestrator")
+_trace_listener: Optional[logging.handlers.QueueListener] = None
+
+
+def _ensure_trace_handler() -> None:
+    """
+    Attach a queue-backed stdout handler for verbose traces.
+
+    Records are pushed onto a queue and written to stdout (where the old
+    print() trace went) by a background listener, keeping console I/O off
+    the query path. The logger doesn't propagate, so the output and its
+    "[Orchestrator]" format are the same whatever logging the host app set
+    up. The listener is stopped at exit, flushing any queued lines.
+    """
+    global _trace_listener
+    if _trace_listener is not None:
+        return
+    records: queue.SimpleQueue = queue.SimpleQueue()
+    console = logging.StreamHandler(sys.stdout)
+    console.setFormatter(logging.Formatter("[Orchestrator] %(message)s"))
+    _trace_listener = logging.handlers.QueueListener(records, console)
+    _trace_listener.start()
+    atexit.register(_trace_listener.stop)
+    logger.addHandler(logging.handlers.QueueHandler(records))
+    logger.setLevel(logging.INFO)
+    logger.propagate = False
+
+
 # ============================================================
 # RATE LIMITER (HARD ENFORCEMENT)
 # ============================================================
@@ -274,6 +308,8 @@ class BatchOptimizedOrchestrator:
     
     def __init__(self, verbose: bool = VERBOSE):
         self.verbose = verbose
+        if verbose:
+            _ensure_trace_handler()
         # Initialize with conditional tertiary fallback: Gemini → Groq → [Qwen if enabled]
         # Qwen controlled by ENABLE_QWEN_FALLBACK feature flag
         self.llm = create_llm_client(primary="gemini", fallback="groq", verbose=verbose)
@@ -282,7 +318,7 @@ class BatchOptimizedOrchestrator:
         key_count = get_gemini_key_count()
         total_limit = 5 * key_count
         if key_count > 1 and self.verbose:
-            print(f"[Orchestrator] 🔑 Multi-key rotation active: {key_count} keys found. Limit increased to {total_limit} RPM.")
+            self._log(f"🔑 Multi-key rotation active: {key_count} keys found. Limit increased to {total_limit} RPM.")
             
         self.rate_limiter = RateLimiter(max_requests=total_limit, window_seconds=60)
         
@@ -293,21 +329,21 @@ class BatchOptimizedOrchestrator:
             if db_type == "sqlite":
                 self.schema_graph = SchemaGraph.from_database(DATABASE_PATH)
                 if self.verbose:
-                    print(f"[Orchestrator] Schema graph loaded: {len(self.schema_graph.all_tables)} tables, {len(self.schema_graph.edges)} FK edges")
+                    self._log(f"Schema graph loaded: {len(self.schema_graph.all_tables)} tables, {len(self.schema_graph.edges)} FK edges")
             else:
                 # PostgreSQL: SchemaGraph doesn't support it yet, use empty graph
                 self.schema_graph = SchemaGraph()
                 if self.verbose:
-                    print(f"[Orchestrator] PostgreSQL detected — FK validation skipped (SchemaGraph supports SQLite only)")
+                    self._log("PostgreSQL detected — FK validation skipped (SchemaGraph supports SQLite only)")
         except Exception as e:
             from backend.tools.schema_graph import SchemaGraph
             self.schema_graph = SchemaGraph()
             if self.verbose:
-                print(f"[Orchestrator] Warning: Could not load schema graph: {e}")
+                self._log(f"Warning: Could not load schema graph: {e}")
     
     def _log(self, message: str):
         if self.verbose:
-            print(f"[Orchestrator] {message}")
+            logger.info(message)
             
     def run_query(self, user_query: str):
         """Alias for backward compatibility."""
@@ -619,12 +655,11 @@ class BatchOptimizedOrchestrator:
         # Format history for prompt
         history_text = ""
         if state.history:
-            history_text = "CONVERSATION HISTORY:\n"
-            for msg in state.history[-5:]: # Last 5 messages
-                role = msg.get("role", "unknown").upper()
-                content = msg.get("content", "")
-                history_text += f"- {role}: {content}\n"
-            history_text += "\n"
+            history_lines = "".join(
+                f"- {msg.get('role', 'unknown').upper()}: {msg.get('content', '')}\n"
+                for msg in state.history[-5:]  # Last 5 messages
+            )
+            history_text = f"CONVERSATION HISTORY:\n{history_lines}\n"
 
         prompt = f"""You are a Multi-Agent SQL Reasoning Team. Analyze the user query.
         
@@ -1433,7 +1468,26 @@ Return JSON:
 # CONVENIENCE FUNCTION
 # ============================================================
 
+# Orchestrators are reused across calls: __init__ builds the LLM client chain
+# and schema graph, while all per-query state lives in BatchPipelineState.
+# Sharing one instance per verbosity also keeps the RateLimiter window global.
+_orchestrators: Dict[bool, BatchOptimizedOrchestrator] = {}
+_orchestrators_lock = threading.Lock()
+
+
+def get_orchestrator(verbose: bool = VERBOSE) -> BatchOptimizedOrchestrator:
+    """Return the shared orchestrator for this verbosity, creating it once."""
+    orchestrator = _orchestrators.get(verbose)
+    if orchestrator is None:
+        with _orchestrators_lock:
+            orchestrator = _orchestrators.get(verbose)
+            if orchestrator is None:
+                orchestrator = BatchOptimizedOrchestrator(verbose=verbose)
+                _orchestrators[verbose] = orchestrator
+    return orchestrator
+
+
 async def run_query(query: str, verbose: bool = VERBOSE, history: List[Dict[str, str]] = None) -> FinalResponse:
     """Run a query with the batch-optimized orchestrator (Async)."""
-    orchestrator = BatchOptimizedOrchestrator(verbose=verbose)
+    orchestrator = get_orchestrator(verbose)
     return await orchestrator.process_query(query, history=history)
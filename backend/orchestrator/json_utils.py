@@ -17,6 +17,14 @@ import re
 from typing import Dict, Any, Optional, Tuple
 
 
+# Compiled once at import; _STRUCTURAL_CHARS lets the brace scan jump between
+# the only characters that affect depth/string state instead of visiting
+# every character in Python.
+_JSON_FENCE = re.compile(r'```json\s*([\s\S]*?)\s*```')
+_GENERIC_FENCE = re.compile(r'```\s*([\s\S]*?)\s*```')
+_STRUCTURAL_CHARS = re.compile(r'[{}"\\]')
+
+
 class JSONExtractionError(Exception):
     """Raised when no valid JSON object can be extracted."""
     pass
@@ -63,7 +71,7 @@ def extract_first_json_block(text: str) -> Tuple[str, Optional[str]]:
     # Handle markdown code blocks
     if "```json" in text:
         # Extract from ```json ... ```
-        match = re.search(r'```json\s*([\s\S]*?)\s*```', text)
+        match = _JSON_FENCE.search(text)
         if match:
             json_candidate = match.group(1).strip()
             # Check if there's text outside the code block
@@ -73,7 +81,7 @@ def extract_first_json_block(text: str) -> Tuple[str, Optional[str]]:
             return json_candidate, stripped
     elif "```" in text:
         # Generic code block
-        match = re.search(r'```\s*([\s\S]*?)\s*```', text)
+        match = _GENERIC_FENCE.search(text)
         if match:
             json_candidate = match.group(1).strip()
             before = text[:match.start()].strip()
@@ -89,19 +97,19 @@ def extract_first_json_block(text: str) -> Tuple[str, Optional[str]]:
     # Track brace depth to find matching closing brace
     depth = 0
     in_string = False
-    escape_next = False
+    escaped_idx = -1
     end_idx = None
     
-    for i in range(start_idx, len(text)):
-        char = text[i]
+    for match in _STRUCTURAL_CHARS.finditer(text, start_idx):
+        i = match.start()
         
-        # Handle string escaping
-        if escape_next:
-            escape_next = False
+        # Handle string escaping (the character right after a backslash)
+        if i == escaped_idx:
             continue
         
+        char = match.group()
         if char == '\\':
-            escape_next = True
+            escaped_idx = i + 1
             continue
         
         # Track string boundaries (braces inside strings don't count)
@@ -113,7 +121,7 @@ def extract_first_json_block(text: str) -> Tuple[str, Optional[str]]:
         if not in_string:
             if char == '{':
                 depth += 1
-            elif char == '}':
+            else:
                 depth -= 1
                 if depth == 0:
                     # Found matching closing brace
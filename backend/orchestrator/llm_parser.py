@@ -34,6 +34,33 @@ import re
 from typing import Dict, Any, List, Optional
 from dataclasses import dataclass
 
+# Optional SIMD-accelerated parser; stdlib json remains the fallback
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Patterns compiled once at import (used on every parse / auto-fix)
+_MARKDOWN_FENCE = re.compile(r'```(?:json)?\s*\n?(.*?)\n?```', re.DOTALL)
+_TRAILING_COMMA = re.compile(r',\s*([}\]])')
+_LINE_COMMENT = re.compile(r'//.*?$', re.MULTILINE)
+_BLOCK_COMMENT = re.compile(r'/\*.*?\*/', re.DOTALL)
+
+# Provider error phrases, matched in one case-insensitive pass (no .lower() copy)
+_PROVIDER_ERROR_PATTERNS = (
+    "rate limit",
+    "quota exceeded",
+    "api error",
+    "authentication failed",
+    "invalid api key",
+    "service unavailable",
+    "request failed",
+)
+_PROVIDER_ERROR = re.compile(
+    "|".join(re.escape(pattern) for pattern in _PROVIDER_ERROR_PATTERNS),
+    re.IGNORECASE,
+)
+
 
 # ============================================================
 # CONTROLLED FAILURE EXCEPTION
@@ -118,7 +145,8 @@ def safe_parse_llm_json(
         raw_response: Raw LLM output string
         agent_name: Name of agent requesting parse (for tracing)
         provider_name: LLM provider name (gemini/groq/qwen)
-        expected_keys: Required keys in JSON (e.g., ["action", "reasoning"])
+        expected_keys: Required keys in JSON (e.g., ["action", "reasoning"]);
+                       a module-level frozenset avoids rebuilding it per call
         auto_fix: Attempt to fix common JSON errors (trailing commas, etc.)
     
     Returns:
@@ -153,7 +181,9 @@ def safe_parse_llm_json(
             raw_response_preview=str(raw_response)[:200]
         )
     
-    if not raw_response.strip():
+    # Strip once; every later step works on this same string
+    content = raw_response.strip()
+    if not content:
         raise ControlledLLMFailure(
             reason="LLM returned empty or whitespace-only response",
             category="empty_response",
@@ -164,25 +194,27 @@ def safe_parse_llm_json(
     
     # ===== STEP 2: EXTRACT JSON FROM RESPONSE =====
     # Some LLMs wrap JSON in markdown code blocks or add preamble
-    content = raw_response.strip()
     original_content = content
     
-    # Remove markdown code blocks if present
-    if content.startswith("```"):
-        # Extract content between ```json and ```
-        match = re.search(r'```(?:json)?\s*\n?(.*?)\n?```', content, re.DOTALL)
-        if match:
-            content = match.group(1).strip()
-        else:
-            # Malformed markdown - try to extract anyway
-            content = content.replace("```json", "").replace("```", "").strip()
-    
-    # Extract JSON object if embedded in text
-    if "{" in content and "}" in content:
-        # Find first { and last }
-        start_idx = content.find("{")
-        end_idx = content.rfind("}") + 1
-        content = content[start_idx:end_idx].strip()
+    # Fast path: a bare {...} object (the common case) is already what the
+    # extraction below would produce, so skip straight to parsing.
+    if not (content.startswith("{") and content.endswith("}")):
+        # Remove markdown code blocks if present
+        if content.startswith("```"):
+            # Extract content between ```json and ```
+            match = _MARKDOWN_FENCE.search(content)
+            if match:
+                content = match.group(1).strip()
+            else:
+                # Malformed markdown - try to extract anyway
+                content = content.replace("```json", "").replace("```", "").strip()
+        
+        # Extract JSON object if embedded in text
+        if "{" in content and "}" in content:
+            # Find first { and last }
+            start_idx = content.find("{")
+            end_idx = content.rfind("}") + 1
+            content = content[start_idx:end_idx].strip()
     
     # Final empty check after extraction
     if not content:
@@ -199,7 +231,7 @@ def safe_parse_llm_json(
     parse_error = None
     
     try:
-        parsed_json = json.loads(content)
+        parsed_json = _loads(content)
     except json.JSONDecodeError as e:
         parse_error = e
         
@@ -209,7 +241,7 @@ def safe_parse_llm_json(
             
             if fixed_content != content:
                 try:
-                    parsed_json = json.loads(fixed_content)
+                    parsed_json = _loads(fixed_content)
                     parse_error = None  # Fixed successfully!
                 except json.JSONDecodeError:
                     pass  # Auto-fix didn't work
@@ -240,11 +272,12 @@ def safe_parse_llm_json(
     
     # ===== STEP 4: STRUCTURE VALIDATION =====
     if expected_keys:
-        missing_keys = [key for key in expected_keys if key not in parsed_json]
+        # frozenset() of a frozenset is a no-op, so callers may pass a cached one
+        missing_keys = frozenset(expected_keys).difference(parsed_json)
         
         if missing_keys:
             raise ControlledLLMFailure(
-                reason=f"Missing required keys: {missing_keys}",
+                reason=f"Missing required keys: {sorted(missing_keys)}",
                 category="schema_violation",
                 agent_name=agent_name,
                 provider_name=provider_name,
@@ -259,6 +292,28 @@ def safe_parse_llm_json(
 # HELPER FUNCTIONS
 # ============================================================
 
+# A run of 19+ digits may exceed 64 bits, which orjson reads as a float
+_LONG_DIGIT_RUN = re.compile(r'\d{19}')
+
+
+def _loads(content: str) -> Any:
+    """
+    Parse JSON with orjson when installed, keeping json.loads semantics.
+
+    orjson accepts a narrower grammar than json.loads: it rejects NaN/Infinity,
+    loses precision on integers beyond 64 bits and reports different error
+    positions. So anything orjson rejects (or may misread) goes through
+    json.loads, and the result or JSONDecodeError (whose pos the truncation
+    heuristic reads) is always the stdlib one.
+    """
+    if orjson is not None and not _LONG_DIGIT_RUN.search(content):
+        try:
+            return orjson.loads(content)
+        except orjson.JSONDecodeError:
+            pass
+    return json.loads(content)
+
+
 def _auto_fix_json(content: str) -> str:
     """
     Attempt to fix common LLM JSON formatting mistakes.
@@ -271,8 +326,12 @@ def _auto_fix_json(content: str) -> str:
     """
     fixed = content
     
+    # Fixes 2-4 are gated on a cheap substring pre-screen (a single C-level
+    # scan) so responses without the trigger skip that pass. Fix 1 isn't:
+    # nearly every multi-key object contains a comma.
+    
     # Fix 1: Remove trailing commas before ] or }
-    fixed = re.sub(r',\s*([}\]])', r'\1', fixed)
+    fixed = _TRAILING_COMMA.sub(r'\1', fixed)
     
     # Fix 2: Replace single quotes with double quotes
     # (only if no double quotes present - avoid breaking escaped quotes)
@@ -280,10 +339,12 @@ def _auto_fix_json(content: str) -> str:
         fixed = fixed.replace("'", '"')
     
     # Fix 3: Remove // comments
-    fixed = re.sub(r'//.*?$', '', fixed, flags=re.MULTILINE)
+    if "//" in fixed:
+        fixed = _LINE_COMMENT.sub('', fixed)
     
     # Fix 4: Remove /* */ comments
-    fixed = re.sub(r'/\*.*?\*/', '', fixed, flags=re.DOTALL)
+    if "/*" in fixed:
+        fixed = _BLOCK_COMMENT.sub('', fixed)
     
     return fixed.strip()
 
@@ -297,8 +358,6 @@ def _detect_failure_category(content: str, parse_error: Optional[json.JSONDecode
     - provider_failure: Looks like error message from provider
     - invalid_format: General JSON syntax error
     """
-    content_lower = content.lower()
-    
     # Detect truncated output
     if parse_error and hasattr(parse_error, 'pos'):
         # If error is near the end of content, likely truncated
@@ -306,17 +365,7 @@ def _detect_failure_category(content: str, parse_error: Optional[json.JSONDecode
             return "truncated_output"
     
     # Detect provider error messages
-    provider_error_patterns = [
-        "rate limit",
-        "quota exceeded",
-        "api error",
-        "authentication failed",
-        "invalid api key",
-        "service unavailable",
-        "request failed"
-    ]
-    
-    if any(pattern in content_lower for pattern in provider_error_patterns):
+    if _PROVIDER_ERROR.search(content):
         return "provider_failure"
     
     # Default to invalid format
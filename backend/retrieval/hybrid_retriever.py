@@ -21,6 +21,7 @@ Cross-Encoder vs Bi-Encoder:
 import logging
 from typing import List, Dict, Tuple, Optional
 
+import numpy as np
 from rank_bm25 import BM25Okapi
 from sentence_transformers import CrossEncoder
 from langchain_core.documents import Document
@@ -142,15 +143,12 @@ class HybridSchemaRetriever:
     def _bm25_retrieve(self, query: str, k: int) -> List[Tuple[Document, float]]:
         """BM25 keyword retrieval."""
         tokenized_query = query.lower().split()
-        scores = self.bm25.get_scores(tokenized_query)
+        scores = np.asarray(self.bm25.get_scores(tokenized_query))
 
-        # Sort by score descending, return top-k
-        ranked = sorted(
-            zip(self._bm25_docs, scores),
-            key=lambda x: x[1],
-            reverse=True,
-        )
-        return [(doc, score) for doc, score in ranked[:k] if score > 0]
+        # Rank on the score vector directly instead of sorting Python tuples;
+        # a stable sort keeps document order for tied scores.
+        top = np.argsort(-scores, kind="stable")[:k]
+        return [(self._bm25_docs[i], float(scores[i])) for i in top if scores[i] > 0]
 
     def _faiss_retrieve(self, query: str, k: int) -> List[Tuple[Document, float]]:
         """FAISS semantic retrieval."""
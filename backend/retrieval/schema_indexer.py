@@ -5,7 +5,7 @@ Builds a FAISS index of database table schemas using HuggingFace embeddings.
 This enables semantic similarity search to find relevant tables for a query.
 
 Architecture:
-    table schemas (text) → HuggingFaceEmbeddings → FAISS index → similarity_search()
+    table schemas (text) → HuggingFaceEmbeddings (unit-norm) → FAISS inner-product index → similarity_search()
 
 Why FAISS over hand-rolled cosine:
 - Optimized ANN (Approximate Nearest Neighbor) algorithms (IVF, HNSW)
@@ -18,7 +18,9 @@ import logging
 from typing import Dict, List, Optional
 from pathlib import Path
 
+import numpy as np
 from langchain_community.vectorstores import FAISS
+from langchain_community.vectorstores.utils import DistanceStrategy
 from langchain_huggingface import HuggingFaceEmbeddings
 from langchain_core.documents import Document
 
@@ -94,8 +96,13 @@ class SchemaIndexer:
             for table_name, schema_text in table_schemas.items()
         ]
 
-        # Build FAISS index
-        self.vectorstore = FAISS.from_documents(self.documents, self.embeddings)
+        # Build FAISS index. Embeddings are L2-normalized at encode time, so an
+        # inner-product index scores cosine similarity directly.
+        self.vectorstore = FAISS.from_documents(
+            self.documents,
+            self.embeddings,
+            distance_strategy=DistanceStrategy.MAX_INNER_PRODUCT,
+        )
 
         logger.info("FAISS index built: %d vectors, dim=%d", len(self.documents), self._get_dimension())
         return self.vectorstore
@@ -111,12 +118,46 @@ class SchemaIndexer:
         Returns:
             List of (Document, similarity_score) tuples, sorted by score desc
         """
+        return self.semantic_search_batch([query], k=k)[0]
+
+    def semantic_search_batch(
+        self, queries: List[str], k: int = 10
+    ) -> List[List[tuple[Document, float]]]:
+        """
+        Semantic search for several queries at once.
+
+        All queries are embedded in a single model forward pass and searched
+        with one FAISS call over the stacked query matrix.
+
+        Args:
+            queries: Natural language queries
+            k: Number of results to return per query
+
+        Returns:
+            One list of (Document, similarity_score) tuples per query,
+            each sorted by score desc
+        """
         if self.vectorstore is None:
             raise RuntimeError("Schema not indexed yet. Call index_schema() first.")
-
-        results = self.vectorstore.similarity_search_with_score(query, k=k)
-        # FAISS returns L2 distance (lower = more similar); convert to similarity
-        return [(doc, 1.0 / (1.0 + score)) for doc, score in results]
+        if not queries:
+            return []
+
+        vectors = np.asarray(self.embeddings.embed_documents(queries), dtype=np.float32)
+        scores, indices = self.vectorstore.index.search(vectors, k)
+
+        id_map = self.vectorstore.index_to_docstore_id
+        docstore = self.vectorstore.docstore
+        batch_results = []
+        for row_scores, row_indices in zip(scores, indices):
+            results = []
+            for score, idx in zip(row_scores, row_indices):
+                if idx == -1:  # FAISS pads with -1 when k exceeds the index size
+                    continue
+                doc = docstore.search(id_map[int(idx)])
+                # Inner product of unit vectors is already the cosine similarity
+                results.append((doc, float(score)))
+            batch_results.append(results)
+        return batch_results
 
     def save(self, path: str | Path) -> None:
         """
@@ -146,6 +187,7 @@ class SchemaIndexer:
             str(path),
             self.embeddings,
             allow_dangerous_deserialization=True,
+            distance_strategy=DistanceStrategy.MAX_INNER_PRODUCT,
         )
         logger.info("FAISS index loaded from %s", path)
 
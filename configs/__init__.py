@@ -9,6 +9,7 @@ from .settings import (
     LLM_MODEL,
     GROQ_MODEL,
     MAX_LLM_CALLS_PER_QUERY,
+    LLM_CONCURRENCY,
     VLLM_BASE_URL,
     VLLM_MODEL,
     ENABLE_VLLM_FALLBACK,
@@ -27,6 +28,7 @@ from .settings import (
     MAX_RETRIES,
     DEFAULT_LIMIT,
     MAX_RESULT_ROWS,
+    SCHEMA_CACHE_TTL,
     VERBOSE,
 
     # Safety
@@ -46,6 +48,7 @@ __all__ = [
     "LLM_MODEL",
     "GROQ_MODEL",
     "MAX_LLM_CALLS_PER_QUERY",
+    "LLM_CONCURRENCY",
     "VLLM_BASE_URL",
     "VLLM_MODEL",
     "ENABLE_VLLM_FALLBACK",
@@ -58,6 +61,7 @@ __all__ = [
     "MAX_RETRIES",
     "DEFAULT_LIMIT",
     "MAX_RESULT_ROWS",
+    "SCHEMA_CACHE_TTL",
     "VERBOSE",
     "FORBIDDEN_KEYWORDS",
     "AGENT_PROMPTS",
@@ -58,6 +58,9 @@ GROQ_MODEL = os.getenv("GROQ_MODEL", "groq/llama-3.1-8b-instant")
 # Token & call limits
 MAX_LLM_CALLS_PER_QUERY = int(os.getenv("MAX_LLM_CALLS_PER_QUERY", "5"))
 
+# Max LLM requests in flight per process (keeps concurrent users under free-tier RPM)
+LLM_CONCURRENCY = int(os.getenv("LLM_CONCURRENCY", "4"))
+
 # vLLM / Qwen (optional self-hosted)
 VLLM_BASE_URL = os.getenv("VLLM_BASE_URL", "http://localhost:8001/v1")
 VLLM_MODEL = os.getenv("VLLM_MODEL", "Qwen/Qwen2.5-Coder-32B-Instruct")
@@ -100,6 +103,7 @@ RAG_THRESHOLD_TABLES = int(os.getenv("RAG_THRESHOLD_TABLES", "5"))
 MAX_RETRIES = int(os.getenv("MAX_RETRIES", "2"))
 DEFAULT_LIMIT = int(os.getenv("DEFAULT_LIMIT", "100"))
 MAX_RESULT_ROWS = int(os.getenv("MAX_RESULT_ROWS", "1000"))
+SCHEMA_CACHE_TTL = int(os.getenv("SCHEMA_CACHE_TTL_SECONDS", "300"))
 VERBOSE = os.getenv("VERBOSE", "false").lower() == "true"
 
 
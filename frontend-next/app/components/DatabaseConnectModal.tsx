@@ -1,13 +1,7 @@
 "use client";
 
 import { useState } from "react";
-
-interface RegisteredDB {
-  id: string;
-  name: string;
-  type: "postgres" | "sqlite";
-  connected: boolean;
-}
+import type { RegisteredDB } from "../types";
 
 interface DatabaseConnectModalProps {
   isOpen: boolean;
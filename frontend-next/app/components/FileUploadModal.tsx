@@ -46,42 +46,40 @@ function isSupported(filename: string): boolean {
   return detectFileType(filename) !== null;
 }
 
+// Per-type presentation, shared by every render (not rebuilt per call / per tile)
+const FILE_TYPE_ICON_PATHS: Record<NonNullable<FileType>, string> = {
+  csv: "M9 12h6m-6 4h6m2 5H7a2 2 0 01-2-2V5a2 2 0 012-2h5.586a1 1 0 01.707.293l5.414 5.414a1 1 0 01.293.707V19a2 2 0 01-2 2z",
+  excel: "M3 10h18M3 14h18m-9-4v8m-7 0h14a2 2 0 002-2V8a2 2 0 00-2-2H5a2 2 0 00-2 2v8a2 2 0 002 2z",
+  sqlite: "M4 7v10c0 2.21 3.582 4 8 4s8-1.79 8-4V7M4 7c0 2.21 3.582 4 8 4s8-1.79 8-4M4 7c0-2.21 3.582-4 8-4s8 1.79 8 4",
+};
+
+function badgeIcon(type: NonNullable<FileType>) {
+  return (
+    <svg xmlns="http://www.w3.org/2000/svg" className="w-3 h-3" fill="none" viewBox="0 0 24 24" stroke="currentColor" strokeWidth={2}>
+      <path strokeLinecap="round" strokeLinejoin="round" d={FILE_TYPE_ICON_PATHS[type]} />
+    </svg>
+  );
+}
+
+const FILE_TYPE_BADGES: Record<NonNullable<FileType>, { label: string; color: string; icon: React.ReactNode }> = {
+  csv: { label: "CSV", color: "bg-emerald-500/20 text-emerald-300 border-emerald-500/30", icon: badgeIcon("csv") },
+  excel: { label: "Excel", color: "bg-green-500/20 text-green-300 border-green-500/30", icon: badgeIcon("excel") },
+  sqlite: { label: "SQLite DB", color: "bg-violet-500/20 text-violet-300 border-violet-500/30", icon: badgeIcon("sqlite") },
+};
+
+const FILE_TYPE_TILES: Record<NonNullable<FileType>, { color: string; title: string; path: string }> = {
+  csv: { color: "bg-emerald-500/15 text-emerald-400", title: "CSV", path: FILE_TYPE_ICON_PATHS.csv },
+  excel: { color: "bg-green-500/15 text-green-400", title: "Excel", path: FILE_TYPE_ICON_PATHS.excel },
+  sqlite: { color: "bg-violet-500/15 text-violet-400", title: "SQLite", path: FILE_TYPE_ICON_PATHS.sqlite },
+};
+
 // ---------------------------------------------------------------------------
 // Sub-components
 // ---------------------------------------------------------------------------
 
 function FileTypeBadge({ type }: { type: FileType }) {
   if (!type) return null;
-  const config: Record<NonNullable<FileType>, { label: string; color: string; icon: React.ReactNode }> = {
-    csv: {
-      label: "CSV",
-      color: "bg-emerald-500/20 text-emerald-300 border-emerald-500/30",
-      icon: (
-        <svg xmlns="http://www.w3.org/2000/svg" className="w-3 h-3" fill="none" viewBox="0 0 24 24" stroke="currentColor" strokeWidth={2}>
-          <path strokeLinecap="round" strokeLinejoin="round" d="M9 12h6m-6 4h6m2 5H7a2 2 0 01-2-2V5a2 2 0 012-2h5.586a1 1 0 01.707.293l5.414 5.414a1 1 0 01.293.707V19a2 2 0 01-2 2z" />
-        </svg>
-      ),
-    },
-    excel: {
-      label: "Excel",
-      color: "bg-green-500/20 text-green-300 border-green-500/30",
-      icon: (
-        <svg xmlns="http://www.w3.org/2000/svg" className="w-3 h-3" fill="none" viewBox="0 0 24 24" stroke="currentColor" strokeWidth={2}>
-          <path strokeLinecap="round" strokeLinejoin="round" d="M3 10h18M3 14h18m-9-4v8m-7 0h14a2 2 0 002-2V8a2 2 0 00-2-2H5a2 2 0 00-2 2v8a2 2 0 002 2z" />
-        </svg>
-      ),
-    },
-    sqlite: {
-      label: "SQLite DB",
-      color: "bg-violet-500/20 text-violet-300 border-violet-500/30",
-      icon: (
-        <svg xmlns="http://www.w3.org/2000/svg" className="w-3 h-3" fill="none" viewBox="0 0 24 24" stroke="currentColor" strokeWidth={2}>
-          <path strokeLinecap="round" strokeLinejoin="round" d="M4 7v10c0 2.21 3.582 4 8 4s8-1.79 8-4V7M4 7c0 2.21 3.582 4 8 4s8-1.79 8-4M4 7c0-2.21 3.582-4 8-4s8 1.79 8 4" />
-        </svg>
-      ),
-    },
-  };
-  const c = config[type];
+  const c = FILE_TYPE_BADGES[type];
   return (
     <span className={`inline-flex items-center gap-1 px-2 py-0.5 rounded-full text-xs font-medium border ${c.color}`}>
       {c.icon}
@@ -320,15 +318,7 @@ export default function FileUploadModal({ open, onClose, apiBase }: FileUploadMo
                 {/* Icons for all 3 types */}
                 <div className="flex items-center justify-center gap-3">
                   {(["csv", "excel", "sqlite"] as const).map((type) => {
-                    const icons = {
-                      csv: { color: "bg-emerald-500/15 text-emerald-400", title: "CSV",
-                        path: "M9 12h6m-6 4h6m2 5H7a2 2 0 01-2-2V5a2 2 0 012-2h5.586a1 1 0 01.707.293l5.414 5.414a1 1 0 01.293.707V19a2 2 0 01-2 2z" },
-                      excel: { color: "bg-green-500/15 text-green-400", title: "Excel",
-                        path: "M3 10h18M3 14h18m-9-4v8m-7 0h14a2 2 0 002-2V8a2 2 0 00-2-2H5a2 2 0 00-2 2v8a2 2 0 002 2z" },
-                      sqlite: { color: "bg-violet-500/15 text-violet-400", title: "SQLite",
-                        path: "M4 7v10c0 2.21 3.582 4 8 4s8-1.79 8-4V7M4 7c0 2.21 3.582 4 8 4s8-1.79 8-4M4 7c0-2.21 3.582-4 8-4s8 1.79 8 4" },
-                    };
-                    const icon = icons[type];
+                    const icon = FILE_TYPE_TILES[type];
                     return (
                       <div key={type} className="flex flex-col items-center gap-1.5">
                         <div className={`w-10 h-10 rounded-xl ${icon.color} flex items-center justify-center`}>
@@ -1,6 +1,7 @@
 "use client";
 
-import { useEffect, useState } from "react";
+import { memo, useEffect, useMemo, useState } from "react";
+import type { StreamEvent } from "../types";
 
 interface PipelineBatch {
     id: number;
@@ -12,14 +13,6 @@ interface PipelineBatch {
     nodeKey: string; // Matches SSE node names
 }
 
-export interface LiveStreamEvent {
-    node: string;
-    label: string;
-    icon: string;
-    description: string;
-    step: number;
-}
-
 const PIPELINE_BATCHES: PipelineBatch[] = [
     {
         id: 1,
@@ -78,45 +71,62 @@ const COMPARISON_POINTS = [
     { naive: "Full schema in every prompt (token waste)", smart: "RAG: top-5 tables only via CrossEncoder reranking" },
 ];
 
+type BatchStatus = "done" | "active" | "pending";
+
+// Status → class names for every styled part of a batch card
+const BATCH_STATUS_CLASSES: Record<BatchStatus, { card: string; title: string; badge: string; arrow: string }> = {
+    done: {
+        card: "bg-emerald-500/10 border-2 border-emerald-500/40",
+        title: "text-emerald-300",
+        badge: "bg-emerald-500/20 text-emerald-300",
+        arrow: "text-emerald-400",
+    },
+    active: {
+        card: "bg-gradient-to-br from-cyan-500/20 to-emerald-500/20 border-2 border-cyan-400/50 animate-pulse-glow scale-105",
+        title: "text-cyan-300",
+        badge: "bg-cyan-500/20 text-cyan-300",
+        arrow: "text-cyan-400 animate-flow",
+    },
+    pending: {
+        card: "bg-white/5 border border-white/10",
+        title: "text-white",
+        badge: "bg-white/5 text-gray-500",
+        arrow: "text-gray-600",
+    },
+};
+
 interface ProcessingDiagramProps {
-    streamEvents?: LiveStreamEvent[];
+    streamEvents?: StreamEvent[];
     isLive?: boolean;
 }
 
-export default function ProcessingDiagram({ streamEvents = [], isLive = false }: ProcessingDiagramProps) {
-    const [activeBatch, setActiveBatch] = useState(0);
+const NO_EVENTS: StreamEvent[] = [];
+
+function ProcessingDiagram({ streamEvents = NO_EVENTS, isLive = false }: ProcessingDiagramProps) {
     const [comparisonIndex, setComparisonIndex] = useState(0);
-    const [completedBatches, setCompletedBatches] = useState<Set<number>>(new Set());
 
-    // When streaming live events, derive active batch from SSE events
-    useEffect(() => {
-        if (isLive && streamEvents.length > 0) {
-            const lastEvent = streamEvents[streamEvents.length - 1];
-            const batchIdx = NODE_TO_BATCH[lastEvent.node];
-            if (batchIdx !== undefined) {
-                setActiveBatch(batchIdx);
-                // Mark all previous batches as completed
-                const newCompleted = new Set<number>();
-                for (let i = 0; i < batchIdx; i++) newCompleted.add(i);
-                setCompletedBatches(newCompleted);
-            }
-            return; // Don't run auto-cycle when live
+    // The diagram is only shown while a query runs, so stage progress comes from
+    // real SSE events: the latest event that maps to a batch is active and every
+    // earlier batch is done. Until the first event arrives, the first stage is active.
+    const liveBatch = useMemo(() => {
+        for (let i = streamEvents.length - 1; i >= 0; i--) {
+            const batchIdx = NODE_TO_BATCH[streamEvents[i].node];
+            if (batchIdx !== undefined) return batchIdx;
         }
+        return undefined;
+    }, [streamEvents]);
+    const currentBatch = isLive && liveBatch !== undefined ? liveBatch : 0;
 
-        // Demo animation when idle
-        const batchInterval = setInterval(() => {
-            setActiveBatch((prev) => (prev + 1) % PIPELINE_BATCHES.length);
-        }, 2000);
+    // Rotate the naive-vs-smart comparison while waiting for the first event
+    useEffect(() => {
+        if (isLive) return;
 
         const compInterval = setInterval(() => {
             setComparisonIndex((prev) => (prev + 1) % COMPARISON_POINTS.length);
         }, 3000);
 
-        return () => {
-            clearInterval(batchInterval);
-            clearInterval(compInterval);
-        };
-    }, [isLive, streamEvents]);
+        return () => clearInterval(compInterval);
+    }, [isLive]);
 
     // Get the latest live agent description when streaming
     const liveDesc = isLive && streamEvents.length > 0
@@ -141,49 +151,34 @@ export default function ProcessingDiagram({ streamEvents = [], isLive = false }:
 
                 {/* Batch Cards */}
                 <div className="flex items-center justify-between gap-2">
-                    {PIPELINE_BATCHES.map((batch, idx) => (
-                        <div key={batch.id} className="flex items-center flex-1">
-                            {/* Batch Card */}
-                            <div
-                                className={`flex-1 rounded-xl p-4 transition-all duration-500 ${
-                                    completedBatches.has(idx)
-                                        ? "bg-emerald-500/10 border-2 border-emerald-500/40"
-                                        : activeBatch === idx
-                                            ? "bg-gradient-to-br from-cyan-500/20 to-emerald-500/20 border-2 border-cyan-400/50 animate-pulse-glow scale-105"
-                                            : "bg-white/5 border border-white/10"
-                                }`}
-                            >
-                                <div className="text-center">
-                                    <div className="text-3xl mb-2">
-                                        {completedBatches.has(idx) ? "✅" : batch.icon}
-                                    </div>
-                                    <div className={`font-semibold text-sm ${
-                                        completedBatches.has(idx) ? "text-emerald-300"
-                                        : activeBatch === idx ? "text-cyan-300" : "text-white"
-                                    }`}>
-                                        {batch.title}
-                                    </div>
-                                    <div className="text-xs text-gray-500 mt-1">{batch.subtitle}</div>
-                                    <div className={`text-xs mt-2 px-2 py-1 rounded-full inline-block ${
-                                        completedBatches.has(idx) ? "bg-emerald-500/20 text-emerald-300"
-                                        : activeBatch === idx ? "bg-cyan-500/20 text-cyan-300"
-                                        : "bg-white/5 text-gray-500"
-                                    }`}>
-                                        {completedBatches.has(idx) ? "Done" : batch.duration}
+                    {PIPELINE_BATCHES.map((batch, idx) => {
+                        const status: BatchStatus = idx < currentBatch ? "done" : idx === currentBatch ? "active" : "pending";
+                        const classes = BATCH_STATUS_CLASSES[status];
+                        return (
+                            <div key={batch.id} className="flex items-center flex-1">
+                                {/* Batch Card */}
+                                <div className={`flex-1 rounded-xl p-4 transition-all duration-500 ${classes.card}`}>
+                                    <div className="text-center">
+                                        <div className="text-3xl mb-2">
+                                            {status === "done" ? "✅" : batch.icon}
+                                        </div>
+                                        <div className={`font-semibold text-sm ${classes.title}`}>
+                                            {batch.title}
+                                        </div>
+                                        <div className="text-xs text-gray-500 mt-1">{batch.subtitle}</div>
+                                        <div className={`text-xs mt-2 px-2 py-1 rounded-full inline-block ${classes.badge}`}>
+                                            {status === "done" ? "Done" : batch.duration}
+                                        </div>
                                     </div>
                                 </div>
-                            </div>
 
-                            {/* Arrow */}
-                            {idx < PIPELINE_BATCHES.length - 1 && (
-                                <div className={`px-2 text-2xl ${
-                                    completedBatches.has(idx) ? "text-emerald-400"
-                                    : activeBatch === idx ? "text-cyan-400 animate-flow"
-                                    : "text-gray-600"
-                                }`}>→</div>
-                            )}
-                        </div>
-                    ))}
+                                {/* Arrow */}
+                                {idx < PIPELINE_BATCHES.length - 1 && (
+                                    <div className={`px-2 text-2xl ${classes.arrow}`}>→</div>
+                                )}
+                            </div>
+                        );
+                    })}
                 </div>
 
                 {/* Active Batch Agents / Live Description */}
@@ -192,7 +187,7 @@ export default function ProcessingDiagram({ streamEvents = [], isLive = false }:
                         <div>
                             <div className="text-xs text-cyan-400 mb-2 animate-pulse">⚡ {liveDesc}</div>
                             <div className="flex justify-center gap-2 flex-wrap">
-                                {PIPELINE_BATCHES[activeBatch]?.agents.map((agent) => (
+                                {PIPELINE_BATCHES[currentBatch]?.agents.map((agent) => (
                                     <span key={agent} className="px-3 py-1 text-xs rounded-full bg-gradient-to-r from-cyan-500/20 to-emerald-500/20 text-cyan-300 border border-cyan-500/30 animate-pulse">
                                         {agent}
                                     </span>
@@ -203,7 +198,7 @@ export default function ProcessingDiagram({ streamEvents = [], isLive = false }:
                         <div>
                             <div className="text-xs text-gray-500 mb-2">Agents in this stage:</div>
                             <div className="flex justify-center gap-2 flex-wrap">
-                                {PIPELINE_BATCHES[activeBatch]?.agents.map((agent) => (
+                                {PIPELINE_BATCHES[currentBatch]?.agents.map((agent) => (
                                     <span key={agent} className="px-3 py-1 text-xs rounded-full bg-gradient-to-r from-cyan-500/20 to-emerald-500/20 text-cyan-300 border border-cyan-500/30">
                                         {agent}
                                     </span>
@@ -268,3 +263,7 @@ export default function ProcessingDiagram({ streamEvents = [], isLive = false }:
         </div>
     );
 }
+
+// Memoized: the diagram only changes when a new SSE event arrives (streamEvents
+// is replaced per chunk), not on the page's other state updates while loading
+export default memo(ProcessingDiagram);
@@ -18,9 +18,9 @@ const SUGGESTIONS = [
 export default function QuerySuggestions({ onSelect }: QuerySuggestionsProps) {
     return (
         <div className="flex gap-2 flex-wrap">
-            {SUGGESTIONS.map((s, i) => (
+            {SUGGESTIONS.map((s) => (
                 <button
-                    key={i}
+                    key={s.label}
                     onClick={() => onSelect(s.query)}
                     title={s.query}
                     className="px-3 py-1.5 text-xs rounded-full bg-white/5 text-gray-400 border border-white/10 hover:bg-cyan-500/10 hover:text-cyan-300 hover:border-cyan-500/30 transition-all duration-200"
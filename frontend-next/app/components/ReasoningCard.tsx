@@ -1,12 +1,7 @@
 "use client";
 
-import { useState } from "react";
-
-interface AgentAction {
-    agent_name: string;
-    summary: string;
-    detail?: string;
-}
+import { memo, useMemo, useState } from "react";
+import type { AgentAction } from "../types";
 
 interface ReasoningCardProps {
     action: AgentAction;
@@ -15,9 +10,50 @@ interface ReasoningCardProps {
     simpleMode: boolean;
 }
 
+type AgentKind =
+    | "intent"
+    | "clarification"
+    | "schema"
+    | "planning"
+    | "sqlGeneration"
+    | "safety"
+    | "execution"
+    | "correction"
+    | "synthesis"
+    | "dataExplorer"
+    | "other";
+
+// Map a lower-cased agent name to its step kind (first match wins)
+function matchAgentKind(agentName: string): AgentKind {
+    if (agentName.includes("intent") || (agentName.includes("batch1") && !agentName.includes("batch2"))) return "intent";
+    if (agentName.includes("clarif")) return "clarification";
+    if (agentName.includes("schema") && !agentName.includes("generator")) return "schema";
+    if (agentName.includes("decompos") || agentName.includes("planner") || agentName.includes("planning")) return "planning";
+    if (agentName.includes("sqlgen") || agentName.includes("generator") ||
+        (agentName.includes("batch2") && agentName.includes("sql")) ||
+        agentName.includes("batch3") || agentName.includes("generation")) return "sqlGeneration";
+    if (agentName.includes("safety") || agentName.includes("valid")) return "safety";
+    if (agentName.includes("execut")) return "execution";
+    if (agentName.includes("correct") || agentName.includes("retry")) return "correction";
+    if (agentName.includes("synth") || agentName.includes("response") || agentName.includes("batch4")) return "synthesis";
+    if (agentName.includes("dataexplorer") || agentName.includes("sample")) return "dataExplorer";
+    return "other";
+}
+
+// Agent names come from a small fixed set, so classify each name only once
+const AGENT_KIND_CACHE = new Map<string, AgentKind>();
+
+function getAgentKind(agentName: string): AgentKind {
+    let kind = AGENT_KIND_CACHE.get(agentName);
+    if (kind === undefined) {
+        kind = matchAgentKind(agentName.toLowerCase());
+        AGENT_KIND_CACHE.set(agentName, kind);
+    }
+    return kind;
+}
+
 // Parse agent action into readable question-answer format
 function parseToReadableStep(action: AgentAction, index: number): { question: string; explanation: string; isLLM: boolean; skip: boolean } {
-    const agentName = action.agent_name.toLowerCase();
     const summary = action.summary || "";
 
     // Skip empty or useless steps
@@ -33,134 +69,128 @@ function parseToReadableStep(action: AgentAction, index: number): { question: st
         return { question: "", explanation: "", isLLM: false, skip: true };
     }
 
-    // Intent Analysis
-    if (agentName.includes("intent") || (agentName.includes("batch1") && !agentName.includes("batch2"))) {
-        const explanation = cleanSummary.includes("DATA")
-            ? "This is a data query - the user wants to retrieve information from the database."
-            : cleanSummary.includes("META")
-                ? "This is a meta query - asking about the database structure itself."
-                : cleanSummary.length > 10 ? cleanSummary : "Analyzing the query to determine if it's asking for data or schema information.";
-        return {
-            question: "What type of query is this?",
-            explanation,
-            isLLM: true,
-            skip: false
-        };
-    }
-
-    // Clarification - only show if there are actual assumptions
-    if (agentName.includes("clarif")) {
-        if (cleanSummary === "Assumptions: []" || cleanSummary.length < 5) {
-            return { question: "", explanation: "", isLLM: false, skip: true };
+    switch (getAgentKind(action.agent_name)) {
+        // Intent Analysis
+        case "intent": {
+            const explanation = cleanSummary.includes("DATA")
+                ? "This is a data query - the user wants to retrieve information from the database."
+                : cleanSummary.includes("META")
+                    ? "This is a meta query - asking about the database structure itself."
+                    : cleanSummary.length > 10 ? cleanSummary : "Analyzing the query to determine if it's asking for data or schema information.";
+            return {
+                question: "What type of query is this?",
+                explanation,
+                isLLM: true,
+                skip: false
+            };
         }
-        return {
-            question: "Are there any assumptions needed?",
-            explanation: cleanSummary,
-            isLLM: true,
-            skip: false
-        };
-    }
 
-    // Schema Exploration
-    if (agentName.includes("schema") && !agentName.includes("generator")) {
-        return {
-            question: "What tables and columns are available?",
-            explanation: cleanSummary.length > 200
-                ? cleanSummary.slice(0, 200) + "..."
-                : cleanSummary || "Exploring the database schema to find relevant tables.",
-            isLLM: false,
-            skip: false
-        };
-    }
+        // Clarification - only show if there are actual assumptions
+        case "clarification":
+            if (cleanSummary === "Assumptions: []" || cleanSummary.length < 5) {
+                return { question: "", explanation: "", isLLM: false, skip: true };
+            }
+            return {
+                question: "Are there any assumptions needed?",
+                explanation: cleanSummary,
+                isLLM: true,
+                skip: false
+            };
 
-    // Query Decomposition / Planning
-    if (agentName.includes("decompos") || agentName.includes("planner") || agentName.includes("planning")) {
-        if (cleanSummary === "[]" || cleanSummary.length < 5) {
-            return { question: "", explanation: "", isLLM: false, skip: true };
-        }
-        return {
-            question: "How should we break down this query?",
-            explanation: cleanSummary || "Breaking down the query into logical steps.",
-            isLLM: true,
-            skip: false
-        };
-    }
+        // Schema Exploration
+        case "schema":
+            return {
+                question: "What tables and columns are available?",
+                explanation: cleanSummary.length > 200
+                    ? cleanSummary.slice(0, 200) + "..."
+                    : cleanSummary || "Exploring the database schema to find relevant tables.",
+                isLLM: false,
+                skip: false
+            };
 
-    // SQL Generation
-    if (agentName.includes("sqlgen") || agentName.includes("generator") ||
-        (agentName.includes("batch2") && agentName.includes("sql")) ||
-        agentName.includes("batch3") || agentName.includes("generation")) {
-        // Check if it contains actual SQL
-        const hasSql = cleanSummary.toUpperCase().includes("SELECT") ||
-            cleanSummary.toUpperCase().includes("FROM");
-        return {
-            question: "What SQL query should we generate?",
-            explanation: hasSql ? cleanSummary : (cleanSummary || "Generating the SQL query based on schema and requirements."),
-            isLLM: true,
-            skip: false
-        };
-    }
+        // Query Decomposition / Planning
+        case "planning":
+            if (cleanSummary === "[]" || cleanSummary.length < 5) {
+                return { question: "", explanation: "", isLLM: false, skip: true };
+            }
+            return {
+                question: "How should we break down this query?",
+                explanation: cleanSummary || "Breaking down the query into logical steps.",
+                isLLM: true,
+                skip: false
+            };
 
-    // Safety Validation
-    if (agentName.includes("safety") || agentName.includes("valid")) {
-        const isBlocked = cleanSummary.toLowerCase().includes("block") || cleanSummary.toLowerCase().includes("denied");
-        return {
-            question: "Is this query safe to execute?",
-            explanation: isBlocked
-                ? `BLOCKED: ${cleanSummary}`
-                : "APPROVED: The query is safe - it's a read-only SELECT with proper limits.",
-            isLLM: false,
-            skip: false
-        };
-    }
+        // SQL Generation
+        case "sqlGeneration": {
+            // Check if it contains actual SQL
+            const upperSummary = cleanSummary.toUpperCase();
+            const hasSql = upperSummary.includes("SELECT") || upperSummary.includes("FROM");
+            return {
+                question: "What SQL query should we generate?",
+                explanation: hasSql ? cleanSummary : (cleanSummary || "Generating the SQL query based on schema and requirements."),
+                isLLM: true,
+                skip: false
+            };
+        }
 
-    // SQL Execution
-    if (agentName.includes("execut")) {
-        // Check if it's just showing the SQL again
-        if (cleanSummary.toUpperCase().startsWith("SELECT")) {
+        // Safety Validation
+        case "safety": {
+            const lowerSummary = cleanSummary.toLowerCase();
+            const isBlocked = lowerSummary.includes("block") || lowerSummary.includes("denied");
             return {
-                question: "Executing the query...",
-                explanation: `Running: ${cleanSummary}`,
+                question: "Is this query safe to execute?",
+                explanation: isBlocked
+                    ? `BLOCKED: ${cleanSummary}`
+                    : "APPROVED: The query is safe - it's a read-only SELECT with proper limits.",
                 isLLM: false,
                 skip: false
             };
         }
-        return {
-            question: "What results did we get?",
-            explanation: cleanSummary || "Executing the validated SQL query.",
-            isLLM: false,
-            skip: false
-        };
-    }
 
-    // Self Correction
-    if (agentName.includes("correct") || agentName.includes("retry")) {
-        return {
-            question: "Did we need to retry?",
-            explanation: cleanSummary || "Checking if any corrections were needed.",
-            isLLM: true,
-            skip: false
-        };
-    }
+        // SQL Execution
+        case "execution":
+            // Check if it's just showing the SQL again
+            if (cleanSummary.toUpperCase().startsWith("SELECT")) {
+                return {
+                    question: "Executing the query...",
+                    explanation: `Running: ${cleanSummary}`,
+                    isLLM: false,
+                    skip: false
+                };
+            }
+            return {
+                question: "What results did we get?",
+                explanation: cleanSummary || "Executing the validated SQL query.",
+                isLLM: false,
+                skip: false
+            };
 
-    // Response Synthesis
-    if (agentName.includes("synth") || agentName.includes("response") || agentName.includes("batch4")) {
-        return {
-            question: "Final answer",
-            explanation: cleanSummary || "Preparing the final response.",
-            isLLM: true,
-            skip: false
-        };
-    }
+        // Self Correction
+        case "correction":
+            return {
+                question: "Did we need to retry?",
+                explanation: cleanSummary || "Checking if any corrections were needed.",
+                isLLM: true,
+                skip: false
+            };
+
+        // Response Synthesis
+        case "synthesis":
+            return {
+                question: "Final answer",
+                explanation: cleanSummary || "Preparing the final response.",
+                isLLM: true,
+                skip: false
+            };
 
-    // Data Explorer
-    if (agentName.includes("dataexplorer") || agentName.includes("sample")) {
-        return {
-            question: "What does the data look like?",
-            explanation: cleanSummary || "Sampling data to understand the format.",
-            isLLM: false,
-            skip: false
-        };
+        // Data Explorer
+        case "dataExplorer":
+            return {
+                question: "What does the data look like?",
+                explanation: cleanSummary || "Sampling data to understand the format.",
+                isLLM: false,
+                skip: false
+            };
     }
 
     // Default - show if there's meaningful content
@@ -168,6 +198,7 @@ function parseToReadableStep(action: AgentAction, index: number): { question: st
         return { question: "", explanation: "", isLLM: false, skip: true };
     }
 
+    const agentName = action.agent_name.toLowerCase();
     return {
         question: action.agent_name.replace(/([A-Z])/g, ' $1').replace(/_/g, ' ').trim(),
         explanation: cleanSummary,
@@ -178,10 +209,23 @@ function parseToReadableStep(action: AgentAction, index: number): { question: st
 
 const TRUNCATE_LENGTH = 200;
 
-export default function ReasoningCard({ action, index, totalSteps, simpleMode }: ReasoningCardProps) {
+// Gradient colors based on position
+const GRADIENT_COLORS = [
+    "from-cyan-500 to-cyan-400",
+    "from-cyan-400 to-teal-400",
+    "from-teal-400 to-teal-500",
+    "from-teal-500 to-emerald-400",
+    "from-emerald-400 to-emerald-500"
+];
+
+// Memoized: a card gets the same action object for as long as a response is
+// shown, so panel re-renders (e.g. revealing the remaining steps) skip the
+// cards that are already on screen
+function ReasoningCard({ action, index, totalSteps, simpleMode }: ReasoningCardProps) {
     const [expanded, setExpanded] = useState(false);
     const [showFullExplanation, setShowFullExplanation] = useState(false);
-    const parsed = parseToReadableStep(action, index);
+    // Parsing does several string scans; toggling show more/raw output shouldn't redo it
+    const parsed = useMemo(() => parseToReadableStep(action, index), [action, index]);
 
     // Skip empty/useless steps
     if (parsed.skip) {
@@ -194,17 +238,8 @@ export default function ReasoningCard({ action, index, totalSteps, simpleMode }:
         ? parsed.explanation.slice(0, TRUNCATE_LENGTH) + "..."
         : parsed.explanation;
 
-    // Gradient colors based on position
-    const gradientColors = [
-        "from-cyan-500 to-cyan-400",
-        "from-cyan-400 to-teal-400",
-        "from-teal-400 to-teal-500",
-        "from-teal-500 to-emerald-400",
-        "from-emerald-400 to-emerald-500"
-    ];
-
     const colorIndex = totalSteps > 0 ? Math.min(Math.floor(index / totalSteps * 5), 4) : 0;
-    const gradientClass = gradientColors[colorIndex];
+    const gradientClass = GRADIENT_COLORS[colorIndex];
 
     return (
         <div className="relative pl-8">
@@ -271,3 +306,5 @@ export default function ReasoningCard({ action, index, totalSteps, simpleMode }:
         </div>
     );
 }
+
+export default memo(ReasoningCard);
@@ -30,6 +30,18 @@ const buildApiUrl = (path: string) => {
 
 type ConnectionState = "checking" | "connected" | "disconnected";
 
+// State → dot / label / text color, looked up instead of rebuilt on every render
+const CONNECTION_STYLES: Record<ConnectionState, { dot: string; label: string; text: string }> = {
+    connected: { dot: "bg-emerald-400 status-dot-pulse", label: "Connected", text: "text-emerald-400" },
+    disconnected: { dot: "bg-red-400", label: "Offline", text: "text-red-400" },
+    checking: { dot: "bg-yellow-400 animate-pulse", label: "Checking…", text: "text-yellow-400" },
+};
+
+// Module-level so React sees one stable component type, not a new one per render
+function StatusDot({ state }: { state: ConnectionState }) {
+    return <span className={`inline-block w-2.5 h-2.5 rounded-full flex-shrink-0 ${CONNECTION_STYLES[state].dot}`} />;
+}
+
 export default function SystemStatus() {
     const [apiStatus, setApiStatus] = useState<ConnectionState>("checking");
     const [dbStatus, setDbStatus] = useState<ConnectionState>("checking");
@@ -60,23 +72,6 @@ export default function SystemStatus() {
         checkHealth();
     }, [checkHealth]);
 
-    const StatusDot = ({ state }: { state: ConnectionState }) => (
-        <span
-            className={`inline-block w-2.5 h-2.5 rounded-full flex-shrink-0 ${state === "connected"
-                ? "bg-emerald-400 status-dot-pulse"
-                : state === "disconnected"
-                    ? "bg-red-400"
-                    : "bg-yellow-400 animate-pulse"
-                }`}
-        />
-    );
-
-    const statusLabel = (state: ConnectionState) =>
-        state === "connected" ? "Connected" : state === "disconnected" ? "Offline" : "Checking…";
-
-    const statusColor = (state: ConnectionState) =>
-        state === "connected" ? "text-emerald-400" : state === "disconnected" ? "text-red-400" : "text-yellow-400";
-
     return (
         <div className="mb-6">
             <div className="flex items-center justify-between mb-3">
@@ -100,7 +95,7 @@ export default function SystemStatus() {
                     <div className="flex-1 min-w-0">
                         <div className="text-xs text-gray-300 font-medium">API (Render)</div>
                     </div>
-                    <span className={`text-xs font-medium ${statusColor(apiStatus)}`}>{statusLabel(apiStatus)}</span>
+                    <span className={`text-xs font-medium ${CONNECTION_STYLES[apiStatus].text}`}>{CONNECTION_STYLES[apiStatus].label}</span>
                 </div>
 
                 {/* Database (Supabase) */}
@@ -109,7 +104,7 @@ export default function SystemStatus() {
                     <div className="flex-1 min-w-0">
                         <div className="text-xs text-gray-300 font-medium">Database</div>
                     </div>
-                    <span className={`text-xs font-medium ${statusColor(dbStatus)}`}>{statusLabel(dbStatus)}</span>
+                    <span className={`text-xs font-medium ${CONNECTION_STYLES[dbStatus].text}`}>{CONNECTION_STYLES[dbStatus].label}</span>
                 </div>
             </div>
 
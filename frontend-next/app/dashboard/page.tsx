@@ -2,13 +2,7 @@
 
 import { useState, useEffect } from "react";
 import Link from "next/link";
-
-interface StatsData {
-    totalQueries: number;
-    successCount: number;
-    totalTimeMs: number;
-    queriesPerDay: Record<string, number>;
-}
+import type { StatsData } from "../types";
 
 interface HistoryEntry {
     query: string;
@@ -22,6 +16,15 @@ function loadJSON<T>(key: string, fallback: T): T {
     try { const s = localStorage.getItem(key); return s ? JSON.parse(s) : fallback; } catch { return fallback; }
 }
 
+// Static KPI card metadata. Class names are written out in full so Tailwind's
+// scanner generates them (it can't see classes assembled from `${color}`).
+const KPI_CARDS = [
+    { label: "Total Queries", icon: "📊", card: "border-cyan-500/20 bg-gradient-to-br from-cyan-500/10 to-transparent", value: "from-cyan-400 to-cyan-300" },
+    { label: "Success Rate", icon: "✅", card: "border-emerald-500/20 bg-gradient-to-br from-emerald-500/10 to-transparent", value: "from-emerald-400 to-emerald-300" },
+    { label: "Avg Time", icon: "⚡", card: "border-amber-500/20 bg-gradient-to-br from-amber-500/10 to-transparent", value: "from-amber-400 to-amber-300" },
+    { label: "Sessions", icon: "📅", card: "border-purple-500/20 bg-gradient-to-br from-purple-500/10 to-transparent", value: "from-purple-400 to-purple-300" },
+];
+
 export default function DashboardPage() {
     const [stats, setStats] = useState<StatsData | null>(null);
     const [history, setHistory] = useState<HistoryEntry[]>([]);
@@ -36,6 +39,9 @@ export default function DashboardPage() {
     const successRate = stats.totalQueries > 0 ? Math.round((stats.successCount / stats.totalQueries) * 100) : 0;
     const avgTime = stats.totalQueries > 0 ? Math.round(stats.totalTimeMs / stats.totalQueries) : 0;
 
+    // Same order as KPI_CARDS
+    const kpiValues = [stats.totalQueries, `${successRate}%`, `${avgTime}ms`, Object.keys(stats.queriesPerDay).length];
+
     // Last 7 days chart data
     const last7Days = Array.from({ length: 7 }, (_, i) => {
         const d = new Date();
@@ -69,18 +75,13 @@ export default function DashboardPage() {
             <main className="max-w-5xl mx-auto px-6 py-8 space-y-8">
                 {/* KPI Cards */}
                 <div className="grid grid-cols-2 lg:grid-cols-4 gap-4">
-                    {[
-                        { label: "Total Queries", value: stats.totalQueries, color: "cyan", icon: "📊" },
-                        { label: "Success Rate", value: `${successRate}%`, color: "emerald", icon: "✅" },
-                        { label: "Avg Time", value: `${avgTime}ms`, color: "amber", icon: "⚡" },
-                        { label: "Sessions", value: Object.keys(stats.queriesPerDay).length, color: "purple", icon: "📅" },
-                    ].map((kpi, i) => (
-                        <div key={i} className={`glass-card rounded-2xl p-5 border border-${kpi.color}-500/20 bg-gradient-to-br from-${kpi.color}-500/10 to-transparent`}>
+                    {KPI_CARDS.map((kpi, i) => (
+                        <div key={kpi.label} className={`glass-card rounded-2xl p-5 border ${kpi.card}`}>
                             <div className="flex items-center justify-between mb-2">
                                 <span className="text-2xl">{kpi.icon}</span>
                             </div>
-                            <div className={`text-3xl font-bold bg-gradient-to-r from-${kpi.color}-400 to-${kpi.color}-300 bg-clip-text text-transparent`}>
-                                {kpi.value}
+                            <div className={`text-3xl font-bold bg-gradient-to-r ${kpi.value} bg-clip-text text-transparent`}>
+                                {kpiValues[i]}
                             </div>
                             <div className="text-xs text-gray-400 mt-1">{kpi.label}</div>
                         </div>
@@ -91,11 +92,11 @@ export default function DashboardPage() {
                 <div className="glass-card rounded-2xl p-6 border border-white/10">
                     <h2 className="text-lg font-semibold text-white mb-4">Queries — Last 7 Days</h2>
                     <div className="flex items-end gap-3 h-40">
-                        {last7Days.map((day, i) => {
+                        {last7Days.map(day => {
                             const count = stats.queriesPerDay[day] || 0;
                             const height = maxDayCount > 0 ? (count / maxDayCount) * 100 : 0;
                             return (
-                                <div key={i} className="flex-1 flex flex-col items-center gap-2">
+                                <div key={day} className="flex-1 flex flex-col items-center gap-2">
                                     <span className="text-xs text-gray-400">{count}</span>
                                     <div className="w-full rounded-t-lg bg-gradient-to-t from-cyan-500/50 to-emerald-500/50 transition-all duration-500"
                                         style={{ height: `${Math.max(height, 4)}%` }} />
@@ -152,7 +153,7 @@ export default function DashboardPage() {
                         ) : (
                             <div className="space-y-3">
                                 {topQueries.map(([q, count], i) => (
-                                    <div key={i} className="flex items-center gap-3">
+                                    <div key={q} className="flex items-center gap-3">
                                         <span className="text-xs text-gray-500 w-5">{i + 1}.</span>
                                         <div className="flex-1 min-w-0">
                                             <div className="text-sm text-gray-300 truncate">{q}</div>
@@ -186,8 +187,8 @@ export default function DashboardPage() {
                                     </tr>
                                 </thead>
                                 <tbody>
-                                    {history.slice(-10).reverse().map((h, i) => (
-                                        <tr key={i} className="border-b border-white/5 hover:bg-white/5 transition-colors">
+                                    {history.slice(-10).reverse().map(h => (
+                                        <tr key={h.timestamp} className="border-b border-white/5 hover:bg-white/5 transition-colors">
                                             <td className="py-2.5 px-3 text-gray-300 max-w-xs truncate">{h.query}</td>
                                             <td className="py-2.5 px-3 text-center">
                                                 <span className={`px-2 py-0.5 rounded-full text-xs ${h.success ? "bg-emerald-500/20 text-emerald-300" : "bg-red-500/20 text-red-300"}`}>
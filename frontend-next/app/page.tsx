@@ -1,62 +1,25 @@
 "use client";
 
-import { useState, useEffect, useRef, useCallback, Suspense } from "react";
-import { useSearchParams, useRouter } from "next/navigation";
+import { useState, useEffect, useRef, useCallback, useMemo, memo, Suspense } from "react";
+import { useSearchParams } from "next/navigation";
+import dynamic from "next/dynamic";
 import ProcessingDiagram from "./components/ProcessingDiagram";
 import ReasoningCard from "./components/ReasoningCard";
 import SystemStatus from "./components/SystemStatus";
 import SchemaExplorer from "./components/SchemaExplorer";
 import QuerySuggestions from "./components/QuerySuggestions";
-import ResultsChart from "./components/ResultsChart";
-import FileUploadModal from "./components/FileUploadModal";
 import FeedbackButtons from "./components/FeedbackButtons";
-import ClarificationModal from "./components/ClarificationModal";
-import DatabaseConnectModal from "./components/DatabaseConnectModal";
 import { useToast } from "./components/Toast";
+import type { AgentAction, QueryResponse, RegisteredDB, StatsData, StreamEvent } from "./types";
 
-// API Types
-interface AgentAction {
-  agent_name: string;
-  summary: string;
-  detail?: string;
-}
-
-interface ReasoningTrace {
-  actions: AgentAction[];
-  final_status: string;
-  total_time_ms?: number;
-  correction_attempts: number;
-}
-
-interface QueryResponse {
-  success: boolean;
-  answer: string;
-  sql_used?: string;
-  data_preview?: Record<string, unknown>[];
-  row_count: number;
-  is_meta_query: boolean;
-  reasoning_trace?: ReasoningTrace;
-  warnings: string[];
-  error?: string;
-  cache_hit?: boolean;
-  run_id?: string;
-}
-
-// SSE stream event from /query/stream
-interface StreamEvent {
-  node: string;
-  label: string;
-  icon: string;
-  description: string;
-  step: number;
-}
+// Recharts is the heaviest dependency on the page and is only needed once a
+// result with data is shown, so load it in its own chunk on first use
+const ResultsChart = dynamic(() => import("./components/ResultsChart"), { ssr: false });
 
-interface RegisteredDB {
-  id: string;
-  name: string;
-  type: "postgres" | "sqlite";
-  connected: boolean;
-}
+// Modals render nothing until opened, so keep them out of the initial bundle too
+const FileUploadModal = dynamic(() => import("./components/FileUploadModal"), { ssr: false });
+const DatabaseConnectModal = dynamic(() => import("./components/DatabaseConnectModal"), { ssr: false });
+const ClarificationModal = dynamic(() => import("./components/ClarificationModal"), { ssr: false });
 
 const getApiBase = () => {
   const envUrl = process.env.NEXT_PUBLIC_API_URL;
@@ -81,14 +44,29 @@ const DEMO_QUERIES = [
   { category: "Safety", query: "DROP TABLE customers", description: "Verify rule-based safety validation" },
 ];
 
+// "How it works" agent grid — static, so built once. Class names are spelled
+// out in full so Tailwind can see them at build time.
+const ARCHITECTURE_AGENTS = [
+  { name: "Intent Analyzer", desc: "Classifies query type", colorClass: "bg-cyan-500/10 border-cyan-500/20" },
+  { name: "Schema Explorer", desc: "Finds relevant tables", colorClass: "bg-teal-500/10 border-teal-500/20" },
+  { name: "SQL Generator", desc: "Writes optimized SQL", colorClass: "bg-emerald-500/10 border-emerald-500/20" },
+  { name: "Safety Validator", desc: "Blocks dangerous ops", colorClass: "bg-amber-500/10 border-amber-500/20" },
+  { name: "FK Validator", desc: "Checks join integrity", colorClass: "bg-blue-500/10 border-blue-500/20" },
+  { name: "Query Executor", desc: "Runs & formats results", colorClass: "bg-indigo-500/10 border-indigo-500/20" },
+  { name: "Self-Corrector", desc: "Fixes errors & retries", colorClass: "bg-purple-500/10 border-purple-500/20" },
+  { name: "Response Synth", desc: "Natural language answer", colorClass: "bg-pink-500/10 border-pink-500/20" },
+];
+
 // ── Persistence helpers ──
 const HISTORY_KEY = "reasonsql_history";
 const BOOKMARKS_KEY = "reasonsql_bookmarks";
 const STATS_KEY = "reasonsql_stats";
+const MAX_HISTORY = 20;
+const MAX_BOOKMARKS = 50;
+const MAX_CONTEXT_TURNS = 5; // follow-up turns sent to the backend as conversation history
 
 interface HistoryEntry { query: string; answer: string; sql_used?: string; success: boolean; time: number; timestamp: number; }
 interface BookmarkEntry { query: string; label: string; timestamp: number; }
-interface StatsData { totalQueries: number; successCount: number; totalTimeMs: number; queriesPerDay: Record<string, number>; }
 
 function loadJSON<T>(key: string, fallback: T): T {
   if (typeof window === "undefined") return fallback;
@@ -99,19 +77,79 @@ function saveJSON<T>(key: string, data: T) {
   try { localStorage.setItem(key, JSON.stringify(data)); } catch { /* ignore */ }
 }
 
+// Last `n` items, newest first, in one pass (no slice + reverse copies)
+function newestFirst<T>(items: T[], n: number): T[] {
+  const out: T[] = [];
+  for (let i = items.length - 1; i >= 0 && out.length < n; i--) out.push(items[i]);
+  return out;
+}
+
 // ── SQL Syntax Highlighting ──
+// One alternation, built once at module load, so the SQL is tokenized in a
+// single pass. Earlier alternatives win: strings, then functions (name
+// followed by "("), then keywords, then numbers.
+const SQL_TOKEN = new RegExp(
+  [
+    "('[^']*')",
+    "\\b(COUNT|SUM|AVG|MIN|MAX|COALESCE|NULLIF|CAST|CONVERT|LENGTH|UPPER|LOWER|TRIM|SUBSTRING|CONCAT|ROUND)(?=\\s*\\()",
+    "\\b(SELECT|FROM|WHERE|JOIN|LEFT|RIGHT|INNER|OUTER|ON|AND|OR|NOT|IN|AS|ORDER|BY|GROUP|HAVING|LIMIT|OFFSET|INSERT|UPDATE|DELETE|CREATE|ALTER|DROP|TABLE|INTO|VALUES|SET|DISTINCT|COUNT|SUM|AVG|MIN|MAX|CASE|WHEN|THEN|ELSE|END|UNION|ALL|EXISTS|BETWEEN|LIKE|IS|NULL|ASC|DESC|TOP|WITH|CROSS|FULL)\\b",
+    "\\b(\\d+\\.?\\d*)\\b",
+  ].join("|"),
+  "gi"
+);
+
+const SQL_TOKEN_CLASSES = ["sql-string", "sql-function", "sql-keyword", "sql-number"];
+
+// The SQL is LLM output injected via innerHTML, so escape it before adding spans.
+// Quotes are left alone: the string-literal pattern matches on them, and text
+// content doesn't need them escaped.
+const HTML_ESCAPES: Record<string, string> = { "&": "&amp;", "<": "&lt;", ">": "&gt;" };
+
+function escapeHTML(text: string): string {
+  return text.replace(/[&<>]/g, ch => HTML_ESCAPES[ch]);
+}
+
+// Highlighted HTML by SQL text: re-running a query, or switching back to an
+// earlier result, reuses the markup. Oldest entry evicted past the limit.
+const HIGHLIGHT_CACHE = new Map<string, string>();
+const HIGHLIGHT_CACHE_SIZE = 20;
+
 function highlightSQL(sql: string): string {
-  const keywords = /\b(SELECT|FROM|WHERE|JOIN|LEFT|RIGHT|INNER|OUTER|ON|AND|OR|NOT|IN|AS|ORDER|BY|GROUP|HAVING|LIMIT|OFFSET|INSERT|UPDATE|DELETE|CREATE|ALTER|DROP|TABLE|INTO|VALUES|SET|DISTINCT|COUNT|SUM|AVG|MIN|MAX|CASE|WHEN|THEN|ELSE|END|UNION|ALL|EXISTS|BETWEEN|LIKE|IS|NULL|ASC|DESC|TOP|WITH|CROSS|FULL)\b/gi;
-  const functions = /\b(COUNT|SUM|AVG|MIN|MAX|COALESCE|NULLIF|CAST|CONVERT|LENGTH|UPPER|LOWER|TRIM|SUBSTRING|CONCAT|ROUND)\s*(?=\()/gi;
-  const strings = /('[^']*')/g;
-  const numbers = /\b(\d+\.?\d*)\b/g;
-
-  let result = sql;
-  result = result.replace(strings, '<span class="sql-string">$1</span>');
-  result = result.replace(functions, '<span class="sql-function">$1</span>');
-  result = result.replace(keywords, '<span class="sql-keyword">$1</span>');
-  result = result.replace(numbers, '<span class="sql-number">$1</span>');
-  return result;
+  let html = HIGHLIGHT_CACHE.get(sql);
+  if (html === undefined) {
+    html = escapeHTML(sql).replace(SQL_TOKEN, (match: string, ...groups: (string | undefined)[]) => {
+      const cls = SQL_TOKEN_CLASSES[groups.findIndex(g => g !== undefined)];
+      return `<span class="${cls}">${match}</span>`;
+    });
+    if (HIGHLIGHT_CACHE.size >= HIGHLIGHT_CACHE_SIZE) {
+      HIGHLIGHT_CACHE.delete(HIGHLIGHT_CACHE.keys().next().value!);
+    }
+    HIGHLIGHT_CACHE.set(sql, html);
+  }
+  return html;
+}
+
+// ── Simple Mode: agents kept in the condensed trace ──
+// Trace agents are named "SchemaRetrieval", "SafetyValidator", "BATCH 1: …", so a
+// prefix test is enough and cannot match a keyword buried inside another name
+const KEY_AGENT_PREFIXES = ["BATCH", "Safety", "Schema"];
+
+function isKeyAgent(action: AgentAction): boolean {
+  return KEY_AGENT_PREFIXES.some(prefix => action.agent_name.startsWith(prefix));
+}
+
+// ── Pipeline strip labels ──
+// "SchemaRetrieval" → "Schema Retrieval", "BATCH 1: Reasoning" → "BATCH 1:".
+// Agent names come from a small fixed set, so each label is built only once.
+const STRIP_LABEL_CACHE = new Map<string, string>();
+
+function stripLabel(agentName: string): string {
+  let label = STRIP_LABEL_CACHE.get(agentName);
+  if (label === undefined) {
+    label = agentName.replace(/([A-Z])/g, ' $1').replace(/_/g, ' ').trim().split(' ').slice(0, 2).join(' ');
+    STRIP_LABEL_CACHE.set(agentName, label);
+  }
+  return label;
 }
 
 // ── CSV export ──
@@ -131,6 +169,134 @@ function downloadCSV(data: Record<string, unknown>[], filename = "results.csv")
   link.click();
 }
 
+// ── Demo query buttons ──
+// Memoized: the list only changes with the selected index, not on every keystroke
+const DemoQueryList = memo(function DemoQueryList({ activeIndex, onSelect }: { activeIndex: number; onSelect: (i: number) => void }) {
+  return (
+    <div className="space-y-2">
+      {DEMO_QUERIES.map((dq, i) => (
+        <button key={dq.category} onClick={() => onSelect(i)}
+          className={`w-full text-left px-3 py-2.5 rounded-xl text-sm transition-all duration-300 ${activeIndex === i
+            ? "bg-gradient-to-r from-cyan-500/20 to-emerald-500/20 text-cyan-300 border border-cyan-500/40 shadow-lg shadow-cyan-500/10"
+            : "bg-white/5 text-gray-300 hover:bg-white/10 hover:text-white border border-transparent"}`}
+        >{dq.category}</button>
+      ))}
+    </div>
+  );
+});
+
+// ── Sidebar history ──
+// One memoized button per entry: entries never change once recorded, so when a
+// query completes only the new entry renders and the rest are reused
+const RecentHistoryItem = memo(function RecentHistoryItem({ entry, onSelect }: { entry: HistoryEntry; onSelect: (query: string) => void }) {
+  return (
+    <button onClick={() => onSelect(entry.query)}
+      className="w-full text-left text-xs bg-white/5 rounded-lg p-3 border border-white/5 hover:bg-white/8 hover:border-white/10 transition-all">
+      <div className="flex items-center gap-2">
+        <span>{entry.success ? "✅" : "❌"}</span>
+        <span className="text-gray-400 truncate flex-1">{entry.query.slice(0, 25)}...</span>
+      </div>
+      <div className="text-gray-500 mt-1">{entry.time.toFixed(0)}ms</div>
+    </button>
+  );
+});
+
+// Memoized as one unit: typing in the query box re-renders the page on every
+// keystroke, but this block only changes when a query completes
+const RecentHistoryList = memo(function RecentHistoryList({ items, onSelect }: { items: HistoryEntry[]; onSelect: (query: string) => void }) {
+  return (
+    <div className="space-y-2">
+      {items.map(h => <RecentHistoryItem key={h.timestamp} entry={h} onSelect={onSelect} />)}
+    </div>
+  );
+});
+
+// ── Reasoning tab ──
+const EAGER_STEP_CARDS = 5;
+
+// Memoized: its props only change with a new response or a Simple Mode toggle,
+// so typing or sidebar clicks don't re-render the full trace
+const ReasoningPanel = memo(function ReasoningPanel({ actions, totalSteps, simpleMode }: { actions: AgentAction[]; totalSteps: number; simpleMode: boolean }) {
+  // Long traces render the first few cards and mount the rest on demand.
+  // Tracking *which* list was expanded resets the window for every new trace.
+  const [expandedFor, setExpandedFor] = useState<AgentAction[] | null>(null);
+  const showAll = expandedFor === actions || actions.length <= EAGER_STEP_CARDS;
+  const shownActions = showAll ? actions : actions.slice(0, EAGER_STEP_CARDS);
+
+  return (
+    <div className="space-y-2">
+      <div className="flex items-center gap-3 mb-6 pb-4 border-b border-white/10">
+        <h3 className="text-xl font-semibold text-white">How I figured it out</h3>
+        <span className="text-gray-500 text-sm">({totalSteps} steps)</span>
+      </div>
+
+      {/* Pipeline visualization */}
+      {totalSteps > 0 && (
+        <div className="mb-6 overflow-x-auto pb-2">
+          <div className="flex items-center gap-1 min-w-max px-2">
+            {actions.map((action, i, arr) => (
+              <div key={i} className="flex items-center gap-1">
+                <div className="px-2.5 py-1 rounded-lg bg-gradient-to-r from-cyan-500/15 to-emerald-500/15 border border-cyan-500/20 text-[10px] text-cyan-300 font-medium whitespace-nowrap">{stripLabel(action.agent_name)}</div>
+                {i < arr.length - 1 && <svg xmlns="http://www.w3.org/2000/svg" className="w-4 h-4 text-gray-600 flex-shrink-0" fill="none" viewBox="0 0 24 24" stroke="currentColor" strokeWidth={2}><path strokeLinecap="round" strokeLinejoin="round" d="M9 5l7 7-7 7" /></svg>}
+              </div>
+            ))}
+          </div>
+        </div>
+      )}
+
+      <div className="pl-4">
+        {shownActions.map((action, i) => (
+          <ReasoningCard key={i} action={action} index={i} totalSteps={actions.length} simpleMode={simpleMode} />
+        ))}
+      </div>
+
+      {!showAll && (
+        <button
+          onClick={() => setExpandedFor(actions)}
+          className="w-full text-sm py-2.5 rounded-xl bg-white/5 text-cyan-300 hover:bg-white/10 border border-white/10 transition-all"
+        >
+          Show remaining {actions.length - EAGER_STEP_CARDS} steps
+        </button>
+      )}
+
+      {simpleMode && (
+        <p className="text-gray-500 text-sm text-center py-4 bg-white/5 rounded-xl">
+          Simple Mode: Showing key agents only. Toggle off for full trace.
+        </p>
+      )}
+    </div>
+  );
+});
+
+// ── Live timer ──
+// Owns its own state so the 100ms tick re-renders only this span, not the whole page.
+// Mounted while a query is running, so it starts from zero each time.
+function ElapsedTimer() {
+  const [elapsedMs, setElapsedMs] = useState(0);
+  useEffect(() => {
+    const start = Date.now();
+    const id = setInterval(() => setElapsedMs(Date.now() - start), 100);
+    return () => clearInterval(id);
+  }, []);
+  return <span className="timer-pulse">{(elapsedMs / 1000).toFixed(1)}s</span>;
+}
+
+// ── Footer ──
+// Fully static, so it is created once: React sees the same element on every
+// render of the page and skips diffing it
+const SITE_FOOTER = (
+  <footer className="text-center py-6 text-gray-500 text-sm border-t border-white/10 bg-black/20">
+    <div className="flex items-center justify-center gap-4 flex-wrap">
+      <span className="bg-gradient-to-r from-cyan-400 to-emerald-400 bg-clip-text text-transparent font-medium">Built with Next.js</span>
+      <span>•</span>
+      <span>12 Agents • FastAPI Backend</span>
+      <span>•</span>
+      <a href="/dashboard" className="text-cyan-400 hover:text-cyan-300 transition-colors">Dashboard</a>
+      <span className="hidden lg:inline">• Ctrl+Enter to submit</span>
+    </div>
+  </footer>
+);
+
 // ── Copy hook ──
 function useCopyFeedback() {
   const [copied, setCopied] = useState<string | null>(null);
@@ -142,9 +308,27 @@ function useCopyFeedback() {
   return { copied, copy };
 }
 
+// ── Copy button ──
+// Owns its "Copied" feedback state, so a copy re-renders this button, not the page
+function CopyBtn({ text, id, label = "Copy" }: { text: string; id: string; label?: string }) {
+  const { copied, copy } = useCopyFeedback();
+  const { addToast } = useToast();
+  return (
+    <button
+      onClick={() => { copy(text, id); addToast(`${label} copied!`, "success"); }}
+      className="inline-flex items-center gap-1 px-2 py-1 rounded-md text-xs bg-white/5 hover:bg-white/10 text-gray-400 hover:text-white transition-all border border-white/10"
+    >
+      {copied === id ? (
+        <><svg xmlns="http://www.w3.org/2000/svg" className="w-3.5 h-3.5 text-emerald-400" fill="none" viewBox="0 0 24 24" stroke="currentColor" strokeWidth={2}><path strokeLinecap="round" strokeLinejoin="round" d="M5 13l4 4L19 7" /></svg><span className="text-emerald-400">Copied</span></>
+      ) : (
+        <><svg xmlns="http://www.w3.org/2000/svg" className="w-3.5 h-3.5" fill="none" viewBox="0 0 24 24" stroke="currentColor" strokeWidth={2}><path strokeLinecap="round" strokeLinejoin="round" d="M8 16H6a2 2 0 01-2-2V6a2 2 0 012-2h8a2 2 0 012 2v2m-6 12h8a2 2 0 002-2v-8a2 2 0 00-2-2h-8a2 2 0 00-2 2v8a2 2 0 002 2z" /></svg><span>{label}</span></>
+      )}
+    </button>
+  );
+}
+
 function HomeInner() {
   const searchParams = useSearchParams();
-  const router = useRouter();
   const { addToast } = useToast();
 
   const [query, setQuery] = useState("");
@@ -158,7 +342,6 @@ function HomeInner() {
   const [conversationHistory, setConversationHistory] = useState<HistoryEntry[]>([]);
   const [bookmarks, setBookmarks] = useState<BookmarkEntry[]>([]);
   const [sidebarOpen, setSidebarOpen] = useState(true);
-  const [elapsedMs, setElapsedMs] = useState(0);
   const [showAbout, setShowAbout] = useState(false);
   const [showVisuals, setShowVisuals] = useState(true);
   const [showUpload, setShowUpload] = useState(false);
@@ -185,32 +368,19 @@ function HomeInner() {
   const [showDbModal, setShowDbModal] = useState(false);
 
   const inputRef = useRef<HTMLInputElement>(null);
-  const timerRef = useRef<ReturnType<typeof setInterval> | null>(null);
-  const { copied, copy } = useCopyFeedback();
 
   // ── Load persisted data on mount ──
+  // Only the initial ?q= is read: the share link written on submit must not re-run this
+  const initialUrlQuery = useRef(searchParams.get("q"));
   useEffect(() => {
     setQueryHistory(loadJSON(HISTORY_KEY, []));
     setBookmarks(loadJSON(BOOKMARKS_KEY, []));
-    // Load query from URL
-    const urlQuery = searchParams.get("q");
+    const urlQuery = initialUrlQuery.current;
     if (urlQuery) {
       setQuery(urlQuery);
       setDemoMode(false);
     }
-  }, [searchParams]);
-
-  // ── Live timer ──
-  useEffect(() => {
-    if (loading) {
-      setElapsedMs(0);
-      const start = Date.now();
-      timerRef.current = setInterval(() => setElapsedMs(Date.now() - start), 100);
-    } else {
-      if (timerRef.current) clearInterval(timerRef.current);
-    }
-    return () => { if (timerRef.current) clearInterval(timerRef.current); };
-  }, [loading]);
+  }, []);
 
   // ── Stats tracking ──
   const trackQuery = useCallback((success: boolean, timeMs: number) => {
@@ -233,15 +403,15 @@ function HomeInner() {
     setStreamEvents([]);
     setShowClarification(false);
 
-    // Shareable link
+    // Shareable link — update the address bar in place, no router navigation
     const url = new URL(window.location.href);
     url.searchParams.set("q", submitQuery);
-    router.replace(url.pathname + url.search, { scroll: false });
+    window.history.replaceState(window.history.state, "", url.pathname + url.search);
 
     const startTime = Date.now();
 
-    // Prepare history from active conversation context (last 5 turns)
-    const history = conversationHistory.slice(-5).flatMap(entry => [
+    // Prepare history from active conversation context (already capped at MAX_CONTEXT_TURNS)
+    const history = conversationHistory.flatMap(entry => [
       { role: "user", content: entry.query },
       {
         role: "assistant",
@@ -279,8 +449,9 @@ function HomeInner() {
       const reader = res.body.getReader();
       const decoder = new TextDecoder();
       let buffer = "";
+      let gotResult = false;
 
-      while (true) {
+      while (!gotResult) {
         const { done, value } = await reader.read();
         if (done) break;
         buffer += decoder.decode(value, { stream: true });
@@ -289,21 +460,30 @@ function HomeInner() {
         const parts = buffer.split("\n\n");
         buffer = parts.pop() || "";
 
+        // Collect this chunk's node events and append them in one state update
+        const nodeEvents: StreamEvent[] = [];
         for (const part of parts) {
           const line = part.replace(/^data: /, "").trim();
           if (!line || line === "[DONE]") continue;
           try {
             const event = JSON.parse(line);
             if (event.type === "node_complete") {
-              setStreamEvents(prev => [...prev, event as StreamEvent]);
+              nodeEvents.push(event as StreamEvent);
             } else if (event.type === "result" && event.data) {
               processResponse(event.data, startTime, submitQuery);
+              gotResult = true;
             } else if (event.type === "error") {
               throw new Error(event.message);
             }
           } catch { /* ignore parse errors */ }
         }
+        if (nodeEvents.length > 0) {
+          setStreamEvents(prev => prev.concat(nodeEvents));
+        }
       }
+      // Only "[DONE]" follows the result. Stop reading now so setLoading(false)
+      // lands in the same render as the result instead of a second one later.
+      if (gotResult) void reader.cancel();
 
     } catch (err) {
       setResponse({
@@ -332,10 +512,13 @@ function HomeInner() {
 
     // Detect AMBIGUOUS → show clarification modal
     if (normalizedData.reasoning_trace?.final_status === "blocked") {
-      const questions = (normalizedData.reasoning_trace?.actions || [])
-        .filter(a => a.agent_name === "ClarificationAgent")
-        .map(a => a.detail || a.summary)
-        .filter(Boolean);
+      // Single pass over the trace — no intermediate filter/map arrays
+      const questions: string[] = [];
+      for (const a of normalizedData.reasoning_trace?.actions || []) {
+        if (a.agent_name !== "ClarificationAgent") continue;
+        const question = a.detail || a.summary;
+        if (question) questions.push(question);
+      }
       setClarificationQuestions(questions);
       setPendingClarificationQuery(submitQuery);
       setShowClarification(true);
@@ -350,8 +533,8 @@ function HomeInner() {
       time: timeMs,
       timestamp: Date.now(),
     };
-    setQueryHistory(prev => { const u = [...prev, newEntry].slice(-20); saveJSON(HISTORY_KEY, u); return u; });
-    setConversationHistory(prev => [...prev, newEntry].slice(-10));
+    setQueryHistory(prev => { const u = [...prev, newEntry].slice(-MAX_HISTORY); saveJSON(HISTORY_KEY, u); return u; });
+    setConversationHistory(prev => [...prev, newEntry].slice(-MAX_CONTEXT_TURNS));
     trackQuery(normalizedData.success, timeMs);
     addToast(
       normalizedData.cache_hit ? "⚡ Served from cache" : (normalizedData.success ? "Query completed" : "Query returned an error"),
@@ -360,14 +543,50 @@ function HomeInner() {
   };
 
   // ── Ctrl+Enter ──
+  // The listener is registered once and calls the latest handleSubmit through a
+  // ref, instead of being torn down and re-added on every keystroke
+  const submitRef = useRef(handleSubmit);
+  useEffect(() => { submitRef.current = handleSubmit; });
   useEffect(() => {
     const handler = (e: KeyboardEvent) => {
-      if ((e.ctrlKey || e.metaKey) && e.key === "Enter") { e.preventDefault(); handleSubmit(); }
+      if ((e.ctrlKey || e.metaKey) && e.key === "Enter") { e.preventDefault(); submitRef.current(); }
     };
     window.addEventListener("keydown", handler);
     return () => window.removeEventListener("keydown", handler);
-    // eslint-disable-next-line react-hooks/exhaustive-deps
-  }, [query, loading]);
+  }, []);
+
+  // ── Reasoning trace (filtered once, shared by the pipeline strip and the step cards) ──
+  const traceActions = response?.reasoning_trace?.actions;
+  const visibleActions = useMemo(() => {
+    if (!traceActions) return [];
+    // Full trace needs no per-action test at all
+    return simpleMode ? traceActions.filter(isKeyAgent) : traceActions;
+  }, [traceActions, simpleMode]);
+
+  // Metrics row is derived from the (immutable) response, so build it once per response
+  const responseMetrics = useMemo(() => response ? [
+    { val: `${(response.reasoning_trace?.total_time_ms ?? 0).toFixed(0)}ms`, label: "Time" },
+    { val: response.row_count, label: "Rows" },
+    { val: response.reasoning_trace?.correction_attempts ?? 0, label: "Retries" },
+    { val: response.reasoning_trace?.actions?.length ?? 0, label: "Steps" },
+  ] : [], [response]);
+
+  // Highlight the generated SQL once per response, not on every re-render of the page
+  const sqlUsed = response?.is_meta_query ? undefined : response?.sql_used;
+  const highlightedSQL = useMemo(() => (sqlUsed ? highlightSQL(sqlUsed) : ""), [sqlUsed]);
+
+  // Latest SQL seen on the stream, shown while execution and synthesis still run
+  const liveSQL = useMemo(() => {
+    for (let i = streamEvents.length - 1; i >= 0; i--) {
+      const sql = streamEvents[i].sql;
+      if (sql) return highlightSQL(sql);
+    }
+    return "";
+  }, [streamEvents]);
+
+  // ── Sidebar lists (recomputed only when the underlying list changes) ──
+  const recentBookmarks = useMemo(() => newestFirst(bookmarks, 5), [bookmarks]);
+  const recentHistory = useMemo(() => newestFirst(queryHistory, 5), [queryHistory]);
 
   // ── Bookmarks ──
   const isBookmarked = bookmarks.some(b => b.query === query.trim());
@@ -379,34 +598,16 @@ function HomeInner() {
       updated = bookmarks.filter(b => b.query !== q);
       addToast("Bookmark removed", "info");
     } else {
-      updated = [...bookmarks, { query: q, label: q.slice(0, 30), timestamp: Date.now() }];
+      updated = [...bookmarks, { query: q, label: q.slice(0, 30), timestamp: Date.now() }].slice(-MAX_BOOKMARKS);
       addToast("Query bookmarked!", "success");
     }
     setBookmarks(updated);
     saveJSON(BOOKMARKS_KEY, updated);
   };
 
-  const runDemoQuery = (i: number) => { setDemoIndex(i); setQuery(DEMO_QUERIES[i].query); };
+  const runDemoQuery = useCallback((i: number) => { setDemoIndex(i); setQuery(DEMO_QUERIES[i].query); }, []);
   const nextDemo = () => { if (demoIndex < DEMO_QUERIES.length - 1) runDemoQuery(demoIndex + 1); };
 
-  const handleCopy = (text: string, id: string, label: string) => {
-    copy(text, id);
-    addToast(`${label} copied!`, "success");
-  };
-
-  const CopyBtn = ({ text, id, label = "Copy" }: { text: string; id: string; label?: string }) => (
-    <button
-      onClick={() => handleCopy(text, id, label)}
-      className="inline-flex items-center gap-1 px-2 py-1 rounded-md text-xs bg-white/5 hover:bg-white/10 text-gray-400 hover:text-white transition-all border border-white/10"
-    >
-      {copied === id ? (
-        <><svg xmlns="http://www.w3.org/2000/svg" className="w-3.5 h-3.5 text-emerald-400" fill="none" viewBox="0 0 24 24" stroke="currentColor" strokeWidth={2}><path strokeLinecap="round" strokeLinejoin="round" d="M5 13l4 4L19 7" /></svg><span className="text-emerald-400">Copied</span></>
-      ) : (
-        <><svg xmlns="http://www.w3.org/2000/svg" className="w-3.5 h-3.5" fill="none" viewBox="0 0 24 24" stroke="currentColor" strokeWidth={2}><path strokeLinecap="round" strokeLinejoin="round" d="M8 16H6a2 2 0 01-2-2V6a2 2 0 012-2h8a2 2 0 012 2v2m-6 12h8a2 2 0 002-2v-8a2 2 0 00-2-2h-8a2 2 0 00-2 2v8a2 2 0 002 2z" /></svg><span>{label}</span></>
-      )}
-    </button>
-  );
-
   return (
     <div className="min-h-screen bg-gradient-to-br from-slate-950 via-blue-950 to-emerald-950 flex bg-orbs bg-grid-pattern">
       {/* Mobile Hamburger */}
@@ -458,21 +659,15 @@ function HomeInner() {
 
         {/* Demo Queries */}
         {demoMode && (
-          <div className="mb-6">
-            <h3 className="text-gray-400 text-sm mb-3 uppercase tracking-wider">Demo Queries</h3>
-            <div className="space-y-2">
-              {DEMO_QUERIES.map((dq, i) => (
-                <button key={i} onClick={() => runDemoQuery(i)}
-                  className={`w-full text-left px-3 py-2.5 rounded-xl text-sm transition-all duration-300 ${demoIndex === i
-                    ? "bg-gradient-to-r from-cyan-500/20 to-emerald-500/20 text-cyan-300 border border-cyan-500/40 shadow-lg shadow-cyan-500/10"
-                    : "bg-white/5 text-gray-300 hover:bg-white/10 hover:text-white border border-transparent"}`}
-                >{dq.category}</button>
-              ))}
+          <>
+            <div className="mb-6">
+              <h3 className="text-gray-400 text-sm mb-3 uppercase tracking-wider">Demo Queries</h3>
+              <DemoQueryList activeIndex={demoIndex} onSelect={runDemoQuery} />
             </div>
-          </div>
+            <hr className="border-white/10 my-4" />
+          </>
         )}
 
-        <hr className="border-white/10 my-4" />
         <SystemStatus />
         <hr className="border-white/10 my-4" />
         <SchemaExplorer />
@@ -488,8 +683,8 @@ function HomeInner() {
                   className="text-[10px] text-gray-600 hover:text-red-400 transition-colors">Clear</button>
               </div>
               <div className="space-y-1.5 max-h-32 overflow-y-auto">
-                {bookmarks.slice(-5).reverse().map((b, i) => (
-                  <button key={i} onClick={() => setQuery(b.query)}
+                {recentBookmarks.map(b => (
+                  <button key={b.query} onClick={() => setQuery(b.query)}
                     className="w-full text-left text-xs px-3 py-2 rounded-lg bg-amber-500/10 text-amber-300 border border-amber-500/20 hover:bg-amber-500/20 transition-all truncate">
                     ★ {b.label}
                   </button>
@@ -523,18 +718,7 @@ function HomeInner() {
               <button onClick={() => { setQueryHistory([]); saveJSON(HISTORY_KEY, []); }}
                 className="text-[10px] text-gray-600 hover:text-red-400 transition-colors">Clear</button>
             </div>
-            <div className="space-y-2">
-              {queryHistory.slice(-5).reverse().map((h, i) => (
-                <button key={i} onClick={() => setQuery(h.query)}
-                  className="w-full text-left text-xs bg-white/5 rounded-lg p-3 border border-white/5 hover:bg-white/8 hover:border-white/10 transition-all">
-                  <div className="flex items-center gap-2">
-                    <span>{h.success ? "✅" : "❌"}</span>
-                    <span className="text-gray-400 truncate flex-1">{h.query.slice(0, 25)}...</span>
-                  </div>
-                  <div className="text-gray-500 mt-1">{h.time.toFixed(0)}ms</div>
-                </button>
-              ))}
-            </div>
+            <RecentHistoryList items={recentHistory} onSelect={setQuery} />
           </div>
         )}
       </aside>
@@ -604,17 +788,8 @@ function HomeInner() {
             <div className="mt-4 max-w-3xl mx-auto glass-card rounded-2xl p-6 text-left animate-fade-in">
               <h3 className="text-white font-semibold mb-3">Multi-Agent Architecture</h3>
               <div className="grid grid-cols-2 lg:grid-cols-4 gap-3 mb-4">
-                {[
-                  { name: "Intent Analyzer", desc: "Classifies query type", color: "cyan" },
-                  { name: "Schema Explorer", desc: "Finds relevant tables", color: "teal" },
-                  { name: "SQL Generator", desc: "Writes optimized SQL", color: "emerald" },
-                  { name: "Safety Validator", desc: "Blocks dangerous ops", color: "amber" },
-                  { name: "FK Validator", desc: "Checks join integrity", color: "blue" },
-                  { name: "Query Executor", desc: "Runs & formats results", color: "indigo" },
-                  { name: "Self-Corrector", desc: "Fixes errors & retries", color: "purple" },
-                  { name: "Response Synth", desc: "Natural language answer", color: "pink" },
-                ].map((agent, i) => (
-                  <div key={i} className={`rounded-lg p-2.5 bg-${agent.color}-500/10 border border-${agent.color}-500/20`}>
+                {ARCHITECTURE_AGENTS.map(agent => (
+                  <div key={agent.name} className={`rounded-lg p-2.5 border ${agent.colorClass}`}>
                     <div className="text-xs font-medium text-white">{agent.name}</div>
                     <div className="text-[10px] text-gray-400 mt-0.5">{agent.desc}</div>
                   </div>
@@ -722,7 +897,7 @@ function HomeInner() {
                 {loading ? (
                   <span className="flex items-center gap-2">
                     <span className="w-5 h-5 border-2 border-white/30 border-t-white rounded-full animate-spin" />
-                    <span className="timer-pulse">{(elapsedMs / 1000).toFixed(1)}s</span>
+                    <ElapsedTimer />
                   </span>
                 ) : conversationHistory.length > 0 ? "Follow-up" : "Run"}
               </button>
@@ -752,6 +927,17 @@ function HomeInner() {
           {loading && (
             <div className="py-8">
               <ProcessingDiagram streamEvents={streamEvents} isLive={streamEvents.length > 0} />
+              {liveSQL && (
+                <div className="mt-6 animate-fade-in">
+                  <h3 className="text-lg font-semibold text-white mb-3">Generated SQL</h3>
+                  <pre className="bg-black/40 rounded-xl p-4 overflow-x-auto border border-emerald-500/20">
+                    <code
+                      className="text-sm font-mono"
+                      dangerouslySetInnerHTML={{ __html: liveSQL }}
+                    />
+                  </pre>
+                </div>
+              )}
             </div>
           )}
 
@@ -784,13 +970,8 @@ function HomeInner() {
                     </button>
                   </div>
                   <div className="flex gap-6 text-sm">
-                    {[
-                      { val: `${(response.reasoning_trace?.total_time_ms ?? 0).toFixed(0)}ms`, label: "Time" },
-                      { val: response.row_count, label: "Rows" },
-                      { val: response.reasoning_trace?.correction_attempts ?? 0, label: "Retries" },
-                      { val: response.reasoning_trace?.actions?.length ?? 0, label: "Steps" },
-                    ].map((m, i) => (
-                      <div key={i} className="text-center">
+                    {responseMetrics.map(m => (
+                      <div key={m.label} className="text-center">
                         <div className="text-white font-semibold text-lg">{m.val}</div>
                         <div className="text-gray-500 text-xs">{m.label}</div>
                       </div>
@@ -816,7 +997,6 @@ function HomeInner() {
                   <div className="space-y-6">
                     {/* Answer */}
                     <div>
-                      <div className="flex items-center justify-between mb-3">
                       <div className="flex items-center justify-between mb-3">
                         <h3 className="text-lg font-semibold text-white">Answer</h3>
                         <CopyBtn text={response.answer} id="answer" label="Copy" />
@@ -831,16 +1011,16 @@ function HomeInner() {
                     </div>
 
                     {/* Generated SQL with syntax highlighting */}
-                    {response.sql_used && !response.is_meta_query && (
+                    {sqlUsed && (
                       <div>
                         <div className="flex items-center justify-between mb-3">
                           <h3 className="text-lg font-semibold text-white">Generated SQL</h3>
-                          <CopyBtn text={response.sql_used} id="sql" label="Copy SQL" />
+                          <CopyBtn text={sqlUsed} id="sql" label="Copy SQL" />
                         </div>
                         <pre className="bg-black/40 rounded-xl p-4 overflow-x-auto border border-emerald-500/20">
                           <code
                             className="text-sm font-mono"
-                            dangerouslySetInnerHTML={{ __html: highlightSQL(response.sql_used) }}
+                            dangerouslySetInnerHTML={{ __html: highlightedSQL }}
                           />
                         </pre>
                       </div>
@@ -899,45 +1079,11 @@ function HomeInner() {
                 )}
 
                 {activeTab === "reasoning" && (
-                  <div className="space-y-2">
-                    <div className="flex items-center gap-3 mb-6 pb-4 border-b border-white/10">
-                      <h3 className="text-xl font-semibold text-white">How I figured it out</h3>
-                      <span className="text-gray-500 text-sm">({response.reasoning_trace?.actions?.length ?? 0} steps)</span>
-                    </div>
-
-                    {/* Pipeline visualization */}
-                    {response.reasoning_trace?.actions && response.reasoning_trace.actions.length > 0 && (
-                      <div className="mb-6 overflow-x-auto pb-2">
-                        <div className="flex items-center gap-1 min-w-max px-2">
-                          {response.reasoning_trace.actions
-                            .filter(a => !simpleMode || a.agent_name.includes("BATCH") || a.agent_name.includes("Safety") || a.agent_name.includes("Schema"))
-                            .map((action, i, arr) => {
-                              const name = action.agent_name.replace(/([A-Z])/g, ' $1').replace(/_/g, ' ').trim().split(' ').slice(0, 2).join(' ');
-                              return (
-                                <div key={i} className="flex items-center gap-1">
-                                  <div className="px-2.5 py-1 rounded-lg bg-gradient-to-r from-cyan-500/15 to-emerald-500/15 border border-cyan-500/20 text-[10px] text-cyan-300 font-medium whitespace-nowrap">{name}</div>
-                                  {i < arr.length - 1 && <svg xmlns="http://www.w3.org/2000/svg" className="w-4 h-4 text-gray-600 flex-shrink-0" fill="none" viewBox="0 0 24 24" stroke="currentColor" strokeWidth={2}><path strokeLinecap="round" strokeLinejoin="round" d="M9 5l7 7-7 7" /></svg>}
-                                </div>
-                              );
-                            })}
-                        </div>
-                      </div>
-                    )}
-
-                    <div className="pl-4">
-                      {(response.reasoning_trace?.actions || [])
-                        .filter(a => !simpleMode || a.agent_name.includes("BATCH") || a.agent_name.includes("Safety") || a.agent_name.includes("Schema"))
-                        .map((action, i, arr) => (
-                          <ReasoningCard key={i} action={action} index={i} totalSteps={arr.length} simpleMode={simpleMode} />
-                        ))}
-                    </div>
-
-                    {simpleMode && (
-                      <p className="text-gray-500 text-sm text-center py-4 bg-white/5 rounded-xl">
-                        Simple Mode: Showing key agents only. Toggle off for full trace.
-                      </p>
-                    )}
-                  </div>
+                  <ReasoningPanel
+                    actions={visibleActions}
+                    totalSteps={response.reasoning_trace?.actions?.length ?? 0}
+                    simpleMode={simpleMode}
+                  />
                 )}
               </div>
             </div>
@@ -945,16 +1091,7 @@ function HomeInner() {
         </main>
 
         {/* Footer */}
-        <footer className="text-center py-6 text-gray-500 text-sm border-t border-white/10 bg-black/20">
-          <div className="flex items-center justify-center gap-4 flex-wrap">
-            <span className="bg-gradient-to-r from-cyan-400 to-emerald-400 bg-clip-text text-transparent font-medium">Built with Next.js</span>
-            <span>•</span>
-            <span>12 Agents • FastAPI Backend</span>
-            <span>•</span>
-            <a href="/dashboard" className="text-cyan-400 hover:text-cyan-300 transition-colors">Dashboard</a>
-            <span className="hidden lg:inline">• Ctrl+Enter to submit</span>
-          </div>
-        </footer>
+        {SITE_FOOTER}
       </div>
 
       {/* File Upload Modal */}
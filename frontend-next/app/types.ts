@@ -0,0 +1,57 @@
+// Shared types for the API payloads and client-side records used across
+// the page, dashboard and components — one definition each, so they can't drift.
+
+// ── API (/query, /query/stream, /databases) ──
+
+export interface AgentAction {
+  agent_name: string;
+  summary: string;
+  detail?: string;
+}
+
+export interface ReasoningTrace {
+  actions: AgentAction[];
+  final_status: string;
+  total_time_ms?: number;
+  correction_attempts: number;
+}
+
+export interface QueryResponse {
+  success: boolean;
+  answer: string;
+  sql_used?: string;
+  data_preview?: Record<string, unknown>[];
+  row_count: number;
+  is_meta_query: boolean;
+  reasoning_trace?: ReasoningTrace;
+  warnings: string[];
+  error?: string;
+  cache_hit?: boolean;
+  run_id?: string;
+}
+
+// SSE node_complete event from /query/stream
+export interface StreamEvent {
+  node: string;
+  label: string;
+  icon: string;
+  description: string;
+  step: number;
+  sql?: string;   // set by the SQL-producing nodes (generation, safety, correction)
+}
+
+export interface RegisteredDB {
+  id: string;
+  name: string;
+  type: "postgres" | "sqlite";
+  connected: boolean;
+}
+
+// ── localStorage records ──
+
+export interface StatsData {
+  totalQueries: number;
+  successCount: number;
+  totalTimeMs: number;
+  queriesPerDay: Record<string, number>;
+}
@@ -27,8 +27,6 @@ import time
 from pathlib import Path
 from typing import Optional
 
-import httpx
-
 try:
     from rich.console import Console
     from rich.table import Table
@@ -170,6 +168,9 @@ def main():
                         help="Request timeout in seconds (default: 60)")
     args = parser.parse_args()
 
+    # Imported here so --help and offline scoring don't pay for the HTTP stack
+    import httpx
+
     # Load test cases
     with open(GOLDEN_CASES) as f:
         cases = json.load(f)
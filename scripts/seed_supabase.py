@@ -52,6 +52,10 @@ def run():
         with open(seed_path, "r", encoding="utf-8") as f:
             seed_sql = f.read()
         try:
+            # Setup-only: don't wait on WAL flush per commit while bulk loading.
+            # The seed file is sent as one multi-statement query, so Postgres
+            # already applies it inside a single implicit transaction.
+            cursor.execute("SET synchronous_commit TO OFF")
             cursor.execute(seed_sql)
             print("[✓] Seed data applied!")
         except Exception as e:
@@ -22,9 +22,25 @@ os.environ.setdefault("LLM_PROVIDER", "gemini")
 os.environ.setdefault("ENABLE_DEBUG_ENDPOINTS", "false")
 
 from fastapi.testclient import TestClient
-from backend.api.main import app
 
-client = TestClient(app)
+
+@pytest.fixture(scope="session")
+def client():
+    """Build the app client once per session, on first use (not at collection)."""
+    from backend.api.main import app
+    return TestClient(app)
+
+
+@pytest.fixture(scope="session")
+def health_response(client):
+    """GET /health once; the read-only checks below share the response."""
+    return client.get("/health")
+
+
+@pytest.fixture(scope="session")
+def databases_list_response(client):
+    """GET /databases once; the read-only checks below share the response."""
+    return client.get("/databases")
 
 
 # =============================================================================
@@ -34,13 +50,11 @@ client = TestClient(app)
 class TestHealthEndpoint:
     """Tests for GET /health."""
 
-    def test_health_returns_200(self):
-        response = client.get("/health")
-        assert response.status_code == 200
+    def test_health_returns_200(self, health_response):
+        assert health_response.status_code == 200
 
-    def test_health_response_shape(self):
-        response = client.get("/health")
-        data = response.json()
+    def test_health_response_shape(self, health_response):
+        data = health_response.json()
         assert "status" in data
         assert "version" in data
         assert "database_connected" in data
@@ -56,24 +70,24 @@ class TestHealthEndpoint:
 class TestQueryEndpoint:
     """Tests for POST /query."""
 
-    def test_query_unknown_database_returns_404(self):
+    def test_query_unknown_database_returns_404(self, client):
         response = client.post("/query", json={
             "query": "How many customers?",
             "database_id": "nonexistent_db",
         })
         assert response.status_code == 404
 
-    def test_query_empty_string_returns_422(self):
+    def test_query_empty_string_returns_422(self, client):
         response = client.post("/query", json={
             "query": "",
         })
         assert response.status_code == 422
 
-    def test_query_missing_field_returns_422(self):
+    def test_query_missing_field_returns_422(self, client):
         response = client.post("/query", json={})
         assert response.status_code == 422
 
-    def test_query_too_long_returns_422(self):
+    def test_query_too_long_returns_422(self, client):
         long_query = "a" * 2001
         response = client.post("/query", json={
             "query": long_query,
@@ -88,28 +102,27 @@ class TestQueryEndpoint:
 class TestDatabasesEndpoint:
     """Tests for /databases routes."""
 
-    def test_list_databases_returns_200(self):
-        response = client.get("/databases")
-        assert response.status_code == 200
-        data = response.json()
+    def test_list_databases_returns_200(self, databases_list_response):
+        assert databases_list_response.status_code == 200
+        data = databases_list_response.json()
         assert "databases" in data
         assert isinstance(data["databases"], list)
 
-    def test_register_sqlite_missing_path_returns_400(self):
+    def test_register_sqlite_missing_path_returns_400(self, client):
         response = client.post("/databases", json={
             "id": "test_db",
             "type": "sqlite",
         })
         assert response.status_code == 400
 
-    def test_register_postgres_missing_string_returns_400(self):
+    def test_register_postgres_missing_string_returns_400(self, client):
         response = client.post("/databases", json={
             "id": "test_db",
             "type": "postgres",
         })
         assert response.status_code == 400
 
-    def test_get_schema_unknown_db_returns_404(self):
+    def test_get_schema_unknown_db_returns_404(self, client):
         response = client.get("/databases/nonexistent_db_xyz/schema")
         assert response.status_code == 404
 
@@ -121,7 +134,7 @@ class TestDatabasesEndpoint:
 class TestDebugEndpoint:
     """Tests for GET /debug-db."""
 
-    def test_debug_disabled_returns_404(self):
+    def test_debug_disabled_returns_404(self, client):
         """When ENABLE_DEBUG_ENDPOINTS=false, debug-db should return 404."""
         response = client.get("/debug-db")
         assert response.status_code == 404
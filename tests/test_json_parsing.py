@@ -0,0 +1,161 @@
+"""
+Tests for the safe LLM JSON parser (backend/orchestrator/llm_parser.py).
+
+llm_parser only depends on the standard library (plus optional orjson), but
+importing it as backend.orchestrator.llm_parser runs backend/__init__, which
+pulls in the whole pipeline (DATABASE_URL, sentence_transformers, LangChain).
+The module is therefore loaded straight from its file, so these tests need no
+LLM, database or network.
+"""
+
+import importlib.util
+import math
+from pathlib import Path
+
+import pytest
+
+_PARSER_PATH = Path(__file__).parent.parent / "backend" / "orchestrator" / "llm_parser.py"
+_spec = importlib.util.spec_from_file_location("llm_parser", _PARSER_PATH)
+llm_parser = importlib.util.module_from_spec(_spec)
+_spec.loader.exec_module(llm_parser)
+
+ControlledLLMFailure = llm_parser.ControlledLLMFailure
+safe_parse_llm_json = llm_parser.safe_parse_llm_json
+validate_agent_response = llm_parser.validate_agent_response
+
+
+# =============================================================================
+# EMPTY / NON-STRING RESPONSES
+# =============================================================================
+
+@pytest.mark.parametrize("raw", [None, "", "   \n\t  "])
+def test_empty_response(raw):
+    with pytest.raises(ControlledLLMFailure) as exc:
+        safe_parse_llm_json(raw, agent_name="TestAgent", provider_name="gemini")
+    assert exc.value.category == "empty_response"
+    assert exc.value.agent_name == "TestAgent"
+
+
+def test_non_string_response():
+    with pytest.raises(ControlledLLMFailure) as exc:
+        safe_parse_llm_json(42, agent_name="TestAgent")
+    assert exc.value.category == "invalid_format"
+
+
+# =============================================================================
+# PROVIDER FAILURES
+# =============================================================================
+
+@pytest.mark.parametrize("raw", [
+    "Error: rate limit reached, please retry later",
+    "Quota exceeded for this API key",
+    "Service Unavailable",
+])
+def test_provider_error_message(raw):
+    with pytest.raises(ControlledLLMFailure) as exc:
+        safe_parse_llm_json(raw, agent_name="TestAgent", provider_name="groq")
+    assert exc.value.category == "provider_failure"
+    assert exc.value.provider_name == "groq"
+
+
+# =============================================================================
+# EXTRACTION
+# =============================================================================
+
+def test_plain_json():
+    assert safe_parse_llm_json('{"action": "query", "n": 1}') == {"action": "query", "n": 1}
+
+
+def test_markdown_fenced_json():
+    raw = '```json\n{"action": "query"}\n```'
+    assert safe_parse_llm_json(raw) == {"action": "query"}
+
+
+def test_json_embedded_in_text():
+    raw = 'Here is my analysis: {"action": "query", "nested": {"a": [1, 2]}} Hope this helps!'
+    assert safe_parse_llm_json(raw) == {"action": "query", "nested": {"a": [1, 2]}}
+
+
+# =============================================================================
+# STDLIB-COMPATIBLE NUMBERS (orjson is narrower than json.loads)
+# =============================================================================
+
+def test_nan_and_infinity_accepted():
+    result = safe_parse_llm_json('{"a": NaN, "b": Infinity, "c": -Infinity}')
+    assert math.isnan(result["a"])
+    assert result["b"] == math.inf and result["c"] == -math.inf
+
+
+def test_big_int_keeps_precision():
+    result = safe_parse_llm_json('{"id": 123456789012345678901234567890}')
+    assert result["id"] == 123456789012345678901234567890
+    assert isinstance(result["id"], int)
+
+
+# =============================================================================
+# AUTO-FIX
+# =============================================================================
+
+@pytest.mark.parametrize("raw, expected", [
+    ('{"a": 1, "b": [1, 2,],}', {"a": 1, "b": [1, 2]}),
+    ("{'a': 'x'}", {"a": "x"}),
+    ('{"a": 1 // trailing comment\n}', {"a": 1}),
+    ('{"a": /* inline */ 1}', {"a": 1}),
+])
+def test_auto_fix(raw, expected):
+    assert safe_parse_llm_json(raw) == expected
+
+
+def test_auto_fix_disabled():
+    with pytest.raises(ControlledLLMFailure) as exc:
+        safe_parse_llm_json('{"a": 1,}', auto_fix=False)
+    assert exc.value.category == "invalid_format"
+
+
+# =============================================================================
+# STRUCTURE VALIDATION
+# =============================================================================
+
+def test_expected_keys_present():
+    result = safe_parse_llm_json(
+        '{"action": "query", "reasoning": "r", "output": null}',
+        expected_keys=["action", "reasoning", "output"],
+    )
+    assert result["action"] == "query"
+
+
+def test_expected_keys_missing():
+    with pytest.raises(ControlledLLMFailure) as exc:
+        safe_parse_llm_json('{"action": "query"}', expected_keys=["action", "reasoning"])
+    assert exc.value.category == "schema_violation"
+    assert "reasoning" in exc.value.reason
+
+
+def test_validate_agent_response_defaults():
+    result = validate_agent_response({"action": "query"}, agent_name="TestAgent")
+    assert result["output"] is None
+    assert "TestAgent" in result["reasoning"]
+
+
+def test_validate_agent_response_requires_action():
+    with pytest.raises(ControlledLLMFailure) as exc:
+        validate_agent_response({"reasoning": "r"})
+    assert exc.value.category == "schema_violation"
+
+
+# =============================================================================
+# TRUNCATION / ABORT STATE
+# =============================================================================
+
+def test_truncated_output():
+    with pytest.raises(ControlledLLMFailure) as exc:
+        safe_parse_llm_json('{"action": "query", "items": [1, 2, 3', agent_name="TestAgent")
+    assert exc.value.category == "truncated_output"
+
+
+def test_abort_response_shape():
+    failure = ControlledLLMFailure(reason="bad", category="invalid_format", agent_name="A", provider_name="p")
+    abort = failure.get_abort_response()
+    assert abort["action"] == "abort"
+    assert abort["parsing_failed"] is True
+    assert abort["failure_category"] == "invalid_format"